@@ -1,38 +1,120 @@
+import asyncio
+import json
+import re
+import time
+from pathlib import Path
+
+import aiohttp
 import mistune
-import requests
 
-class LinkExtractor(mistune.HTMLRenderer):
-    def __init__(self):
-        super().__init__()
-        self.links = []
+def extract_links(tokens):
+  """Sammelt rekursiv alle Link-URLs aus dem Markdown-AST"""
+  links = []
+  for token in tokens:
+    if token["type"] == "link":
+      links.append(token["attrs"]["url"])
+    if "children" in token:
+      links.extend(extract_links(token["children"]))
+  return links
+
+
+# Nur http(s)-Links werden geprüft (mailto:, Anker, relative Pfade nicht)
+_HTTP_RE = re.compile(r"^https?://").match
+
+# Lokaler Cache der Prüfergebnisse (wird über den GitLab-CI-Cache persistiert)
+CACHE_FILE = Path(".link-cache.json")
+CACHE_TTL_OK = 24 * 60 * 60  # Erfolgreiche Checks: 24h
+CACHE_TTL_FAILED = 10 * 60   # Fehlgeschlagene Checks: 10 Minuten
+
+
+def load_cache():
+  """Lädt den Cache und verwirft abgelaufene Einträge"""
+  try:
+    with open(CACHE_FILE, "r") as f:
+      entries = json.load(f)
+  except (OSError, ValueError):
+    return {}
+
+  now = time.time()
+  return {
+    url: entry for url, entry in entries.items()
+    if now - entry["checked_at"] < (CACHE_TTL_OK if entry["status"] == 200 else CACHE_TTL_FAILED)
+  }
+
+
+def save_cache(entries):
+  """Schreibt den Cache zurück auf die Platte"""
+  try:
+    with open(CACHE_FILE, "w") as f:
+      json.dump(entries, f)
+  except OSError as e:
+    print(f"⚠️  Link-Cache konnte nicht geschrieben werden: {e}")
 
-    def link(self, text, **attrs):  # Accepts text + attributes as kwargs
-        self.links.append({
-            "url": attrs.get('url') or attrs.get('href'),  # Handle both possible keys
-            "text": text
-        })
-        return super().link(text, **attrs)  # Pass through to parent
+
+def report(url, status, error):
+  """Klassifiziert ein Prüfergebnis als OK oder defekt"""
+  if error:
+    broken_links.append(f"- ❌ {url} (Error: {error})")
+  elif status != 200:
+    broken_links.append(f"- ❌ {url} (Status: {status})")
+  else:
+    print(f"✅ {url} (OK --> {status})")
+
+
+async def check_url(session, url):
+  """
+  HEAD-Request mit Fallback auf einen Range-GET, falls der Server HEAD
+  ablehnt. Der Body wird dabei nicht gelesen.
+  """
+  try:
+    async with session.head(url, allow_redirects=True) as response:
+      status = response.status
+    if status in (405, 501):
+      async with session.get(url, allow_redirects=True, headers={"Range": "bytes=0-0"}) as response:
+        status = response.status
+      # 206 Partial Content zählt als erreichbar
+      if status == 206:
+        status = 200
+    return url, status, None
+  except Exception as e:
+    return url, None, str(e) or type(e).__name__
+
+
+async def check_urls(urls):
+  """
+  Prüft alle URLs nebenläufig in einem Event-Loop.
+  Der Connector hält Keep-Alive-Verbindungen pro Host offen, begrenzt die
+  Verbindungen pro Host und cached DNS-Auflösungen.
+  """
+  connector = aiohttp.TCPConnector(limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=30)
+  # Getrennte Connect-/Read-Timeouts, damit langsam tröpfelnde Server
+  # nicht unbegrenzt blockieren
+  timeout = aiohttp.ClientTimeout(total=10, sock_connect=4, sock_read=6)
+  async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+    return await asyncio.gather(*[check_url(session, url) for url in urls])
 
 # Usage
 with open("README.md", "r") as f:
     content = f.read()
 
-renderer = LinkExtractor()
-markdown = mistune.create_markdown(renderer=renderer)
-markdown(content)
+# Nur den AST erzeugen, kein HTML rendern
+markdown = mistune.create_markdown(renderer=None)
+links = extract_links(markdown(content))
 broken_links = []
 
-for link in  renderer.links:
-  url = link["url"]
-  if url.startswith(("http://", "https://")):
-    try:
-      response = requests.head(url, allow_redirects=True, timeout=10)
-      if response.status_code != 200:
-        broken_links.append(f"- ❌ {url} (Status: {response.status_code})")
-      else:
-        print(f"✅ {url} (OK --> {response.status_code})")
-    except Exception as e:
-      broken_links.append(f"- ❌ {url} (Error: {str(e)})")
+urls = [url for url in links if url and _HTTP_RE(url)]
+
+cache = load_cache()
+for url in urls:
+  if url in cache:
+    report(url, cache[url]["status"], cache[url]["error"])
+urls = [url for url in urls if url not in cache]
+
+for url, status, error in asyncio.run(check_urls(urls)):
+  cache[url] = {"status": status, "error": error, "checked_at": time.time()}
+  report(url, status, error)
+
+save_cache(cache)
 
 if broken_links:
   print("\n🔗 Broken links found:")
@@ -44,4 +126,4 @@ if broken_links:
 else:
   print("\n✅ All links are working!")
   with open("broken-links.md", "w") as f:
-    f.write("# All links are working! 🎉")
\ No newline at end of file
+    f.write("# All links are working! 🎉")
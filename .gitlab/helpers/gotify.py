@@ -4,11 +4,31 @@ Gotify Notification Sender for CI/CD Pipelines
 Sends test failure notifications to Gotify server
 """
 
+import io
 import os
 import sys
+import time
 from pathlib import Path
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session():
+  """Session mit Retry-Strategie für transiente Netzwerk-/Serverfehler"""
+  retry = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(["POST"]),
+    raise_on_status=False  # Letzte Response zurückgeben, raise_for_status() übernimmt
+  )
+  adapter = HTTPAdapter(max_retries=retry)
+
+  session = requests.Session()
+  session.mount("http://", adapter)
+  session.mount("https://", adapter)
+  return session
 
 
 def send_gotify_notification():
@@ -45,13 +65,23 @@ def send_gotify_notification():
     failed_tests = "Keine Details verfügbar"
     test_count = 0
   else:
+    # Zeilenweise lesen: nur die ersten ~1000 Zeichen für die Anzeige puffern,
+    # den Rest der Datei nur noch zählen
+    preview = io.StringIO()
+    test_count = 0
     with open(failed_tests_file, "r", encoding="utf-8") as f:
-      content = f.read().strip()
-      if not content:
-        print("ℹ️  Keine fehlgeschlagenen Tests gefunden")
-        return  # Nichts zu senden
-      failed_tests = content
-      test_count = len([line for line in content.split('\n') if line.strip()])
+      for line in f:
+        if line.strip():
+          test_count += 1
+        preview.write(line)
+        if preview.tell() > 1000:
+          break
+      test_count += sum(1 for line in f if line.strip())
+
+    if not test_count:
+      print("ℹ️  Keine fehlgeschlagenen Tests gefunden")
+      return  # Nichts zu senden
+    failed_tests = preview.getvalue().strip()
 
   # ===========================================
   # 3. Build Message
@@ -59,30 +89,22 @@ def send_gotify_notification():
 
   title = f"🔴 CI Pipeline Fehler - {ci_project_name}"
 
-  # Markdown-formatierte Nachricht
-  message_parts = [
-    f"**Branch:** `{ci_commit_branch}`",
-    f"**Commit:** `{ci_commit_short_sha}`",
-  ]
-
-  if ci_commit_message:
-    # Erste Zeile der Commit-Message
-    first_line = ci_commit_message.split('\n')[0][:100]
-    message_parts.append(f"**Message:** {first_line}")
-
-  message_parts.extend([
-    f"**Fehlgeschlagene Tests:** {test_count}",
-    "",
-    "### Details:",
-    "```",
-    failed_tests[:1000],  # Limitiere auf 1000 Zeichen
-    "```"
-  ])
-
-  if len(failed_tests) > 1000:
-    message_parts.append("\n_... (gekürzt)_")
-
-  message = "\n".join(message_parts)
+  # Erste Zeile der Commit-Message
+  commit_line = f"**Message:** {ci_commit_message.split(chr(10), 1)[0][:100]}\n" if ci_commit_message else ""
+  truncated = "\n\n_... (gekürzt)_" if len(failed_tests) > 1000 else ""
+
+  # Markdown-formatierte Nachricht (Details auf 1000 Zeichen limitiert)
+  message = (
+    f"**Branch:** `{ci_commit_branch}`\n"
+    f"**Commit:** `{ci_commit_short_sha}`\n"
+    f"{commit_line}"
+    f"**Fehlgeschlagene Tests:** {test_count}\n"
+    "\n"
+    "### Details:\n"
+    "```\n"
+    f"{failed_tests[:1000]}\n"
+    f"```{truncated}"
+  )
 
   # ===========================================
   # 4. Build Payload
@@ -108,7 +130,7 @@ def send_gotify_notification():
         "pipeline_url": ci_pipeline_url,
         "job_id": ci_job_id,
         "project": ci_project_name,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
       }
     }
   }
@@ -122,19 +144,21 @@ def send_gotify_notification():
     print(f"   Tests fehlgeschlagen: {test_count}")
     print(f"   Commit: {ci_commit_short_sha} ({ci_commit_branch})")
 
-    response = requests.post(
-      f"{gotify_url}/message",
-      params={"token": gotify_app_token},
-      json=payload,
-      timeout=10,
-      # verify=True ist default - requests verwendet certifi automatisch
-    )
+    with create_session() as session:
+      response = session.post(
+        f"{gotify_url}/message",
+        params={"token": gotify_app_token},
+        json=payload,
+        timeout=10,
+        # verify=True ist default - requests verwendet certifi automatisch
+      )
 
     response.raise_for_status()
+    data = response.json() if response.content else {}
 
     print(f"✅ Benachrichtigung erfolgreich gesendet!")
     print(f"   Response: {response.status_code}")
-    print(f"   Message ID: {response.json().get('id', 'unknown')}")
+    print(f"   Message ID: {data.get('id', 'unknown')}")
 
   except requests.exceptions.SSLError as e:
     print(f"❌ SSL-Fehler: {e}")
@@ -3,8 +3,70 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible.plugins.action import ActionBase
-from ansible.errors import AnsibleActionFail
-import json
+from xml.sax.saxutils import XMLGenerator
+import io
+import re
+
+
+# Pflichtparameter jedes Requests (body/body_dict wird separat geprüft)
+_REQUIRED_KEYS = frozenset(('endpoint_url', 'soap_action'))
+
+# Nur für den Aufbau aus body_dict benötigt, nicht ans Modul weitergegeben
+_BODY_DICT_KEYS = frozenset(('body_dict', 'body_root_tag', 'namespace', 'namespace_prefix'))
+
+# http(s)-URL mit Host, entspricht den Regeln des Url Value Objects
+_URL_RE = re.compile(r'https?://[^/?#\s]+(?:[/?#]\S*)?', re.IGNORECASE)
+
+
+def _serialize_body(content, root_tag, namespace=None, namespace_prefix='ns'):
+  """
+  Schreibt content per XMLGenerator direkt als XML-String, ohne
+  Zwischenbaum aus Elementen. Leere Elemente werden als <tag/> geschrieben.
+  """
+  if namespace:
+    # Ohne Prefix wie bei ElementTree: ns0
+    prefix = namespace_prefix or 'ns0'
+    tag_prefix = prefix + ':'
+    root_attrs = {'xmlns:' + prefix: namespace}
+  else:
+    tag_prefix = ''
+    root_attrs = {}
+
+  out = io.StringIO()
+  generator = XMLGenerator(out, short_empty_elements=True)
+  start, end, characters = generator.startElement, generator.endElement, generator.characters
+
+  root = tag_prefix + root_tag
+  start(root, root_attrs)
+
+  if isinstance(content, dict):
+    # Iterativ über einen Stack: (Tag, Wert, Liste auflösen);
+    # Liste auflösen None markiert den schließenden Tag
+    stack = [(tag_prefix + key, value, True) for key, value in reversed(list(content.items()))]
+    while stack:
+      tag, value, expand = stack.pop()
+      if expand is None:
+        end(tag)
+      elif expand and isinstance(value, (list, tuple)):
+        # Listen als wiederholte Elemente
+        stack.extend((tag, item, False) for item in reversed(value))
+      elif isinstance(value, dict):
+        start(tag, {})
+        stack.append((tag, None, None))
+        stack.extend((tag_prefix + key, child, True) for key, child in reversed(list(value.items())))
+      else:
+        start(tag, {})
+        text = str(value)
+        if text:
+          characters(text)
+        end(tag)
+  else:
+    text = str(content)
+    if text:
+      characters(text)
+
+  end(root)
+  return out.getvalue()
 
 
 class ActionModule(ActionBase):
@@ -31,49 +93,78 @@ class ActionModule(ActionBase):
         'msg': 'Parameter "requests" ist erforderlich'
       }
 
-    # Jedes Request verarbeiten (body_dict -> body)
+    # Jedes Request verarbeiten (body_dict -> body). Bewusst sequenziell:
+    # der Aufbau hält den GIL, ein Thread-Pool wäre hier langsamer
     processed_requests = []
+    # endpoint_url als eigene Spalte für die gemeinsame Prüfung unten
+    endpoint_urls = []
 
     for idx, req in enumerate(requests):
-      processed_req = dict(req)  # Copy
-
-      # Wenn body_dict vorhanden: in XML umwandeln
-      if 'body_dict' in processed_req:
-        try:
-          body_xml = self._build_xml_body(
-            body_dict=processed_req.pop('body_dict'),
-            root_tag=processed_req.pop('body_root_tag', None),
-            namespace=processed_req.pop('namespace', None),
-            namespace_prefix=processed_req.pop('namespace_prefix', 'ns')
-          )
-          processed_req['body'] = body_xml
-        except Exception as e:
-          return {
-            'failed': True,
-            'msg': f'Fehler beim Erstellen von Request #{idx + 1} XML Body: {str(e)}'
-          }
-
-      # Validierung
-      if 'body' not in processed_req:
+      # Validierung vor dem XML-Aufbau
+      has_body = 'body' in req
+      if has_body == ('body_dict' in req):
         return {
           'failed': True,
-          'msg': f'Request #{idx + 1}: Weder "body" noch "body_dict" angegeben'
+          'msg': (f'Request #{idx + 1}: "body" und "body_dict" schließen sich aus' if has_body
+                  else f'Request #{idx + 1}: Weder "body" noch "body_dict" angegeben')
         }
 
-      if 'endpoint_url' not in processed_req:
+      missing = _REQUIRED_KEYS - req.keys()
+      if missing:
         return {
           'failed': True,
-          'msg': f'Request #{idx + 1}: Parameter "endpoint_url" fehlt'
+          'msg': f'Request #{idx + 1}: Parameter "{", ".join(sorted(missing))}" fehlt'
         }
 
-      if 'soap_action' not in processed_req:
+      endpoint_urls.append(req['endpoint_url'])
+
+      # Mit body wird das Request unverändert weitergereicht (keine Kopie)
+      if has_body:
+        processed_requests.append(req)
+        continue
+
+      # body_dict -> body; die Bau-Parameter werden nicht ans Modul übergeben
+      try:
+        body_xml = self._build_xml_body(
+          body_dict=req['body_dict'],
+          root_tag=req.get('body_root_tag'),
+          namespace=req.get('namespace'),
+          namespace_prefix=req.get('namespace_prefix', 'ns')
+        )
+      except Exception as e:
         return {
           'failed': True,
-          'msg': f'Request #{idx + 1}: Parameter "soap_action" fehlt'
+          'msg': f'Fehler beim Erstellen von Request #{idx + 1} XML Body: {str(e)}'
         }
 
+      processed_req = {key: value for key, value in req.items() if key not in _BODY_DICT_KEYS}
+      processed_req['body'] = body_xml
       processed_requests.append(processed_req)
 
+    # URLs aller Requests auf einmal prüfen und gesammelt melden
+    invalid_urls = [
+      f'#{idx + 1}: {url}'
+      for idx, url in enumerate(endpoint_urls)
+      if not _URL_RE.fullmatch(str(url).strip())
+    ]
+    if invalid_urls:
+      return {
+        'failed': True,
+        'msg': 'Ungültige endpoint_url in Request ' + ', '.join(invalid_urls),
+        'invalid_urls': invalid_urls
+      }
+
+    # Im Check-Mode nach der Validierung abbrechen, ohne das Modul auf dem
+    # Zielsystem auszuführen
+    if self._task.check_mode:
+      result.update({
+        'changed': False,
+        'skipped': True,
+        'msg': 'Check mode: would process {} requests'.format(len(processed_requests)),
+        'total': len(processed_requests)
+      })
+      return result
+
     # Module Args vorbereiten
     module_args = {
       'requests': processed_requests,
@@ -95,73 +186,21 @@ class ActionModule(ActionBase):
     return result
 
   def _build_xml_body(self, body_dict, root_tag=None, namespace=None, namespace_prefix='ns'):
-    """Baut XML Body aus Dictionary (wie in soap_request)"""
+    """
+    Baut XML Body aus Dictionary (wie in soap_request).
+    Der String wird per XMLGenerator direkt geschrieben.
+    """
     try:
-      from xml.etree import ElementTree as ET
-
-      # Root Element
       if root_tag:
-        if namespace:
-          root = ET.Element(f'{{{namespace}}}{root_tag}')
-        else:
-          root = ET.Element(root_tag)
+        content = body_dict
       else:
         # Nimm ersten Key als Root
         if not body_dict:
           raise ValueError("body_dict ist leer")
-        root_key = list(body_dict.keys())[0]
-        root_value = body_dict[root_key]
-
-        if namespace:
-          root = ET.Element(f'{{{namespace}}}{root_key}')
-        else:
-          root = ET.Element(root_key)
+        root_tag = next(iter(body_dict))
+        content = body_dict[root_tag]
 
-        if isinstance(root_value, dict):
-          self._dict_to_xml(root_value, root, namespace, namespace_prefix)
-        else:
-          root.text = str(root_value)
-
-        # Early return wenn kein root_tag
-        if not root_tag:
-          return ET.tostring(root, encoding='unicode', method='xml')
-
-      # Body Content hinzufügen
-      if root_tag:
-        self._dict_to_xml(body_dict, root, namespace, namespace_prefix)
-
-      # Namespace Registration für pretty output
-      if namespace and namespace_prefix:
-        ET.register_namespace(namespace_prefix, namespace)
-
-      return ET.tostring(root, encoding='unicode', method='xml')
+      return _serialize_body(content, root_tag, namespace, namespace_prefix)
 
     except Exception as e:
       raise ValueError(f'Fehler beim XML-Aufbau: {str(e)}')
-
-  def _dict_to_xml(self, data, parent, namespace=None, namespace_prefix='ns'):
-    """Konvertiert Dictionary zu XML Elementen"""
-    from xml.etree import ElementTree as ET
-    for key, value in data.items():
-      if namespace:
-        child = ET.SubElement(parent, f'{{{namespace}}}{key}')
-      else:
-        child = ET.SubElement(parent, key)
-
-      if isinstance(value, dict):
-        self._dict_to_xml(value, child, namespace, namespace_prefix)
-      elif isinstance(value, (list, tuple)):
-        # Listen als wiederholte Elemente
-        parent.remove(child)
-        for item in value:
-          if namespace:
-            list_child = ET.SubElement(parent, f'{{{namespace}}}{key}')
-          else:
-            list_child = ET.SubElement(parent, key)
-
-          if isinstance(item, dict):
-            self._dict_to_xml(item, list_child, namespace, namespace_prefix)
-          else:
-            list_child.text = str(item)
-      else:
-        child.text = str(value)
\ No newline at end of file
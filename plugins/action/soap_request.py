@@ -7,6 +7,44 @@ from ansible.plugins.action import ActionBase
 from ansible.errors import AnsibleError
 
 
+# Liste aller Parameter die Templating brauchen
+_TEMPLATE_FIELDS = frozenset((
+  'endpoint_url',
+  'soap_action',
+  'body',
+  'body_dict',
+  'body_root_tag',
+  'namespace',
+  'namespace_prefix',
+  'skip_request_wrapper',
+  'soap_version',
+  'soap_header',
+  'headers',
+  'timeout',
+  'auth_type',
+  'username',
+  'password',
+  'cert_path',
+  'key_path',
+  'validate_certs',
+  'use_cache',
+  'max_retries',
+  'extract_xpath',
+  'strip_namespaces',
+  'validate',
+))
+
+# Jinja2-Marker (Ausdruck, Anweisung, Kommentar)
+_JINJA_MARKERS = ('{{', '{%', '{#')
+
+
+def _needs_templating(value):
+  """Strings nur mit Jinja2-Markern; Listen/Dicts können verschachtelte Ausdrücke enthalten"""
+  if isinstance(value, str):
+    return any(marker in value for marker in _JINJA_MARKERS)
+  return isinstance(value, (dict, list, tuple))
+
+
 class ActionModule(ActionBase):
   """Action plugin for soap_request module"""
 
@@ -20,40 +58,40 @@ class ActionModule(ActionBase):
     # Get module args
     module_args = self._task.args.copy()
 
-    # Liste aller Parameter die Templating brauchen
-    template_fields = [
-      'endpoint_url',
-      'soap_action',
-      'body',
-      'body_dict',
-      'body_root_tag',
-      'namespace',
-      'namespace_prefix',
-      'skip_request_wrapper',
-      'soap_version',
-      'soap_header',
-      'headers',
-      'timeout',
-      'auth_type',
-      'username',
-      'password',
-      'cert_path',
-      'key_path',
-      'validate_certs',
-      'use_cache',
-      'max_retries',
-      'extract_xpath',
-      'strip_namespaces',
-      'validate'
-    ]
-
-    # Template alle vorhandenen Parameter
-    for key in template_fields:
-      if key in module_args:
-        try:
-          module_args[key] = self._templar.template(module_args[key])
-        except Exception as e:
-          raise AnsibleError(f"Failed to template parameter '{key}': {str(e)}")
+    # Nur Parameter mit (möglichen) Jinja2-Ausdrücken templaten, alle in
+    # einem Templar-Aufruf
+    to_template = {
+      key: value for key, value in module_args.items()
+      if key in _TEMPLATE_FIELDS and _needs_templating(value)
+    }
+
+    if to_template:
+      try:
+        module_args.update(self._templar.template(to_template))
+      except Exception:
+        # Fehlerhaften Parameter für die Meldung ermitteln
+        for key, value in to_template.items():
+          try:
+            self._templar.template(value)
+          except Exception as e:
+            raise AnsibleError(f"Failed to template parameter '{key}': {str(e)}")
+        raise
+
+    # XPath ohne umgebende Leerzeichen/Zeilenumbrüche (z.B. aus YAML-Block-
+    # Scalars), damit gleiche Ausdrücke denselben Eintrag im XPath-Cache treffen
+    extract_xpath = module_args.get('extract_xpath')
+    if isinstance(extract_xpath, str):
+      module_args['extract_xpath'] = extract_xpath.strip() or None
+
+    # Im Check-Mode keinen Request senden: Modul-Transfer und Ausführung
+    # auf dem Zielsystem überspringen
+    if self._task.check_mode:
+      result.update({
+        'changed': False,
+        'skipped': True,
+        'msg': 'Check mode: would send SOAP request to {}'.format(module_args.get('endpoint_url'))
+      })
+      return result
 
     # Modul ausführen
     result.update(
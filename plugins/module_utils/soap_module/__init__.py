@@ -4,23 +4,36 @@ SOAP Module - Clean Architecture Implementation
 Diese Collection implementiert SOAP-Client-Funktionalität nach Clean Architecture Prinzipien.
 """
 
-from .application.dtos import SoapRequestDTO, SoapResponseDTO
-from .application.mappers import DtoMapper
-from .application.use_cases import (
-    SendSoapRequestUseCase,
-    BatchSendUseCase,
-    ValidateEndpointUseCase
-)
-from .infrastructure.repositories import HttpSoapRepository
+from importlib import import_module
 
 __version__ = '1.0.1'
 
-__all__ = [
-    'SoapRequestDTO',
-    'SoapResponseDTO',
-    'DtoMapper',
-    'SendSoapRequestUseCase',
-    'BatchSendUseCase',
-    'ValidateEndpointUseCase',
-    'HttpSoapRepository'
-]
+# Öffentliche Namen und das Paket, aus dem sie stammen. Geladen wird erst
+# beim ersten Zugriff (PEP 562), damit Importe einzelner Submodule nicht den
+# gesamten Objektgraphen nachziehen.
+_EXPORTS = {
+    'SoapRequestDTO': '.application.dtos',
+    'SoapResponseDTO': '.application.dtos',
+    'DtoMapper': '.application.mappers',
+    'SendSoapRequestUseCase': '.application.use_cases',
+    'BatchSendUseCase': '.application.use_cases',
+    'ValidateEndpointUseCase': '.application.use_cases',
+    'HttpSoapRepository': '.infrastructure.repositories',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Lädt exportierte Namen beim ersten Zugriff"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
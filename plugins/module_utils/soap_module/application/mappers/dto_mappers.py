@@ -1,6 +1,8 @@
 """
 Mapper zwischen DTOs und Domain-Objekten.
 """
+from typing import Dict, Optional, Tuple
+
 from ..dtos.soap_request_dto import SoapRequestDTO, SoapResponseDTO
 from ...domain.entities.endpoint import Endpoint
 from ...domain.entities.soap_response import SoapResponse
@@ -8,7 +10,20 @@ from ..use_cases.send_soap_request_use_case import (
   SendSoapRequestCommand,
   SendSoapRequestResult
 )
-from ...domain.value_objects.auth_type import AuthType
+
+
+def _create_endpoint(dto: SoapRequestDTO) -> Endpoint:
+  """Erstellt den Endpoint aus URL, Authentifizierung und Timeout des DTO"""
+  return Endpoint(
+    url=dto.endpoint_url,
+    name="default",
+    auth_type=dto.auth_type,
+    username=dto.username,
+    password=dto.password,
+    cert_path=dto.cert_path,
+    key_path=dto.key_path,
+    default_timeout=dto.timeout
+  )
 
 
 class DtoMapper:
@@ -17,36 +32,32 @@ class DtoMapper:
   """
 
   @staticmethod
-  def dto_to_command(dto: SoapRequestDTO) -> SendSoapRequestCommand:
+  def dto_to_command(
+      dto: SoapRequestDTO,
+      endpoints: Optional[Dict[Tuple, Endpoint]] = None
+  ) -> SendSoapRequestCommand:
     """
     Konvertiert SoapRequestDTO zu SendSoapRequestCommand.
 
     Args:
         dto: Input DTO
+        endpoints: Optional Endpoint-Cache des Aufrufers (z.B. pro Batch);
+            gleiche Konfigurationen teilen sich dann eine Endpoint-Instanz
 
     Returns:
         Command-Objekt
     """
-    # Auth-Type konvertieren
-    if dto.auth_type and dto.auth_type.lower() != 'none':
-      try:
-        auth_type = AuthType[dto.auth_type.upper()]
-      except KeyError:
-        auth_type = None
+    # Endpoint ist immutable und kann innerhalb eines Batches geteilt werden.
+    # Der Cache lebt nur beim Aufrufer, damit Zugangsdaten nicht prozessweit
+    # gehalten werden
+    if endpoints is None:
+      endpoint = _create_endpoint(dto)
     else:
-      auth_type = None
-
-    # Endpoint erstellen
-    endpoint = Endpoint(
-      url=dto.endpoint_url,
-      name="default",
-      auth_type=dto.auth_type,
-      username=dto.username,
-      password=dto.password,
-      cert_path=dto.cert_path,
-      key_path=dto.key_path,
-      default_timeout=dto.timeout
-    )
+      key = (dto.endpoint_url, dto.auth_type, dto.username, dto.password,
+             dto.cert_path, dto.key_path, dto.timeout)
+      endpoint = endpoints.get(key)
+      if endpoint is None:
+        endpoint = endpoints[key] = _create_endpoint(dto)
 
     # Body-Content bestimmen
     body_content = dto.body
@@ -3,7 +3,6 @@ Use Case: Multiple SOAP Requests gleichzeitig senden.
 """
 from typing import List, Dict, Any
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .send_soap_request_use_case import (
     SendSoapRequestUseCase,
@@ -68,7 +67,11 @@ class BatchSendUseCase:
             return self._execute_sequential(command)
 
     def _execute_sequential(self, command: BatchSendCommand) -> BatchSendResult:
-        """Führt Requests sequenziell aus"""
+        """
+        Führt Requests sequenziell aus.
+        Requests an denselben Host laufen über eine Keep-Alive-Verbindung
+        (HTTP/1.1-Pipelining unterstützen http.client/urllib3 nicht).
+        """
         results = []
         successful = 0
         failed = 0
@@ -92,20 +95,33 @@ class BatchSendUseCase:
         )
 
     def _execute_parallel(self, command: BatchSendCommand) -> BatchSendResult:
-        """Führt Requests parallel aus"""
+        """
+        Führt Requests parallel aus.
+
+        Bewusst mit Threads statt asyncio: Service, Repository und HTTP-Client
+        arbeiten synchron, und requests gibt den GIL während der Socket-I/O frei.
+        Die Worker teilen sich den Connection-Pool des Repositories.
+        """
+        # Erst hier importieren: sequenzielle Batches brauchen keinen Thread-Pool
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
         results = []
         successful = 0
         failed = 0
 
-        with ThreadPoolExecutor(max_workers=command.max_workers) as executor:
-            # Futures erstellen
-            future_to_command = {
-                executor.submit(self._send_use_case.execute, cmd): cmd
+        # Nicht mehr Worker als Requests starten (und mindestens einen)
+        max_workers = max(1, min(command.max_workers, len(command.requests)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Alle Futures vor dem Einsammeln erstellen; die Requests teilen
+            # sich die Keep-Alive-Session des Repositories
+            futures = [
+                executor.submit(self._send_use_case.execute, cmd)
                 for cmd in command.requests
-            }
+            ]
 
             # Ergebnisse sammeln
-            for future in as_completed(future_to_command):
+            for future in as_completed(futures):
                 try:
                     result = future.result()
                     results.append(result)
@@ -116,7 +132,7 @@ class BatchSendUseCase:
                         failed += 1
                         if command.stop_on_error:
                             # Verbleibende Futures canceln
-                            for f in future_to_command:
+                            for f in futures:
                                 f.cancel()
                             break
 
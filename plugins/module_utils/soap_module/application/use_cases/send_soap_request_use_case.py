@@ -4,6 +4,7 @@ Orchestriert die Geschäftslogik für das Senden eines SOAP-Requests.
 """
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ...domain.entities.soap_request import SoapRequest
 from ...domain.entities.soap_response import SoapResponse, ResponseStatus
@@ -14,6 +15,12 @@ from ...domain.services.validation_service import ValidationService
 from ...domain.value_objects.soap_action import SoapAction
 
 
+@lru_cache(maxsize=256)
+def _soap_action(action: str, namespace: Optional[str]) -> SoapAction:
+    """SoapAction ist immutable; wiederholte Actions (z.B. im Batch) teilen sich ein Objekt"""
+    return SoapAction.from_string(action, namespace=namespace)
+
+
 @dataclass
 class SendSoapRequestCommand:
     """
@@ -115,10 +122,7 @@ class SendSoapRequestUseCase:
 
         # 2. SOAP Action erstellen
         try:
-            soap_action = SoapAction.from_string(
-                command.soap_action,
-                namespace=command.namespace
-            )
+            soap_action = _soap_action(command.soap_action, command.namespace)
         except ValueError as e:
             return SendSoapRequestResult(
                 success=False,
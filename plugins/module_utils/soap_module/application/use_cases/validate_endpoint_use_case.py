@@ -2,13 +2,74 @@
 Use Case: Endpoint validieren.
 Prüft ob ein Endpoint erreichbar und korrekt konfiguriert ist.
 """
-from typing import Optional, Dict, Any
+import io
+import re
+import xml.etree.ElementTree as ET
+from typing import Iterator, Optional, Dict, Any
 from dataclasses import dataclass
 
+try:
+    from lxml import etree as _lxml_etree
+    HAS_LXML = True
+except ImportError:
+    _lxml_etree = None
+    HAS_LXML = False
+
 from ...domain.entities.endpoint import Endpoint
 from ...domain.repositories.soap_repository import SoapRepository
 from ...domain.services.validation_service import ValidationService
 
+# name-Attribut von operation-Tags (Fallback für nicht wohlgeformte WSDLs)
+_OPERATION_RE = re.compile(r'<operation\b[^>]*?\sname="([^"]+)"')
+
+# XML-Deklaration am Dokumentanfang (ihre encoding-Angabe gilt nicht für str)
+_XML_DECLARATION_RE = re.compile(r'\s*<\?xml\s[^>]*\?>')
+
+_WSDL_PARSE_ERRORS = (ET.ParseError, _lxml_etree.XMLSyntaxError) if HAS_LXML else (ET.ParseError,)
+
+
+def _iter_operation_names(wsdl_content: str) -> Iterator[str]:
+    """
+    Liefert die Namen aller operation-Elemente (beliebiger Namespace) in
+    einem Streaming-Durchlauf. Verarbeitete Elemente werden freigegeben.
+    """
+    if HAS_LXML:
+        # lxml liest nur bytes; ohne Deklaration gelten sie als UTF-8
+        declaration = _XML_DECLARATION_RE.match(wsdl_content)
+        if declaration:
+            wsdl_content = wsdl_content[declaration.end():]
+        context = _lxml_etree.iterparse(
+            io.BytesIO(wsdl_content.encode('utf-8')),
+            events=('end',),
+            tag='{*}operation',
+            resolve_entities=False
+        )
+        for _, element in context:
+            name = element.get('name')
+            if name:
+                yield name
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+        return
+
+    for _, element in ET.iterparse(io.StringIO(wsdl_content), events=('end',)):
+        tag = element.tag
+        if tag == 'operation' or tag.endswith('}operation'):
+            name = element.get('name')
+            if name:
+                yield name
+            element.clear()
+
+
+def _wsdl_operations(wsdl_content: str) -> tuple:
+    """Operationen einer WSDL in Dokumentreihenfolge"""
+    # Duplikate entfernen, Reihenfolge aus der WSDL beibehalten
+    try:
+        return tuple(dict.fromkeys(_iter_operation_names(wsdl_content)))
+    except _WSDL_PARSE_ERRORS:
+        return tuple(dict.fromkeys(_OPERATION_RE.findall(wsdl_content)))
+
 
 @dataclass
 class ValidateEndpointCommand:
@@ -119,15 +180,7 @@ class ValidateEndpointUseCase:
 
     def _extract_operations_from_wsdl(self, wsdl_content: str) -> list:
         """
-        Extrahiert Operationen aus WSDL.
-        Vereinfachte Implementierung.
+        Extrahiert die Namen aller operation-Elemente aus der WSDL
+        (portType und binding, ohne Duplikate, in Dokumentreihenfolge).
         """
-        # TODO: Vollständige WSDL-Parsing-Implementierung
-        operations = []
-
-        # Einfaches Pattern-Matching für operation-Tags
-        import re
-        pattern = r'<operation.*?name="([^"]+)"'
-        matches = re.findall(pattern, wsdl_content)
-
-        return list(set(matches))  # Duplikate entfernen
+        return list(_wsdl_operations(wsdl_content))
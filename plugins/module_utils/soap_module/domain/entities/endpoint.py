@@ -2,16 +2,24 @@
 Domain Entity: Endpoint
 Repräsentiert einen SOAP-Endpunkt mit seinen Eigenschaften.
 """
+import re
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from urllib.parse import urlparse
 
+# Validiert Schema + Host in einem Schritt: (scheme, netloc, path)
+_URL_RE = re.compile(r'^(https?)://([^/?#]+)([^?#]*)', re.IGNORECASE)
 
-@dataclass
+# Übersetzungstabelle für die Namensgenerierung aus der URL
+_SLASH_TABLE = str.maketrans({'/': '_'})
+
+
+@dataclass(frozen=True)
 class Endpoint:
     """
     Entity für einen SOAP-Endpunkt.
     Kapselt URL, Authentifizierung und Endpunkt-spezifische Konfiguration.
+    Immutable - abgeleitete Werte werden in __post_init__ gesetzt.
     """
 
     url: str
@@ -41,19 +49,28 @@ class Endpoint:
     supported_operations: List[str] = field(default_factory=list)
     wsdl_url: Optional[str] = None
 
+    # Einmalig zerlegte URL als (scheme, netloc, path) (wird in __post_init__ gesetzt)
+    _url_parts: Optional[Tuple[str, str, str]] = field(default=None, init=False, repr=False, compare=False)
+    # Operationen als frozenset für O(1)-Lookups (wird in __post_init__ gesetzt)
+    _supported_set: frozenset = field(default=frozenset(), init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validierung nach Initialisierung"""
         if not self.url:
             raise ValueError("url ist erforderlich")
 
         # URL validieren
-        parsed = urlparse(self.url)
-        if not parsed.scheme or not parsed.netloc:
-            raise ValueError(f"Ungültige URL: {self.url}")
-
-        if parsed.scheme not in ["http", "https"]:
+        match = _URL_RE.match(self.url)
+        if not match:
+            # Nur im Fehlerfall parsen, um die passende Meldung zu liefern
+            parsed = urlparse(self.url)
+            if not parsed.scheme or not parsed.netloc:
+                raise ValueError(f"Ungültige URL: {self.url}")
             raise ValueError(f"URL muss http oder https verwenden: {self.url}")
 
+        scheme, netloc, path = match.groups()
+        object.__setattr__(self, '_url_parts', (scheme.lower(), netloc, path))
+
         # Auth-Validierung
         if self.auth_type and self.auth_type != "none":
             if self.auth_type not in ["basic", "digest", "ntlm", "certificate"]:
@@ -75,9 +92,11 @@ class Endpoint:
         if self.default_soap_version not in ["1.1", "1.2"]:
             raise ValueError("default_soap_version muss '1.1' oder '1.2' sein")
 
+        object.__setattr__(self, '_supported_set', frozenset(self.supported_operations or ()))
+
         # Name generieren falls nicht vorhanden
         if not self.name:
-            self.name = self._generate_name_from_url()
+            object.__setattr__(self, 'name', self._generate_name_from_url())
 
     @property
     def soap_version(self) -> str:
@@ -86,13 +105,13 @@ class Endpoint:
 
     def _generate_name_from_url(self) -> str:
         """Generiert einen Namen aus der URL"""
-        parsed = urlparse(self.url)
-        return f"{parsed.netloc}{parsed.path}".replace("/", "_").strip("_")
+        _, netloc, path = self._url_parts
+        return (netloc + path).translate(_SLASH_TABLE).strip("_")
 
     def get_base_url(self) -> str:
         """Gibt die Basis-URL zurück (ohne Query-Parameter)"""
-        parsed = urlparse(self.url)
-        return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        scheme, netloc, path = self._url_parts
+        return f"{scheme}://{netloc}{path}"
 
     def requires_auth(self) -> bool:
         """Prüft ob Authentifizierung erforderlich ist"""
@@ -117,9 +136,9 @@ class Endpoint:
 
     def supports_operation(self, operation: str) -> bool:
         """Prüft ob eine Operation unterstützt wird"""
-        if not self.supported_operations:
+        if not self._supported_set:
             return True  # Wenn keine Operationen definiert, alle erlauben
-        return operation in self.supported_operations
+        return operation in self._supported_set
 
     def __repr__(self) -> str:
         return f"Endpoint(name='{self.name}', url='{self.url}', auth={self.auth_type})"
@@ -2,11 +2,26 @@
 Domain Entity: SoapRequest
 Repräsentiert einen SOAP-Request mit allen notwendigen Informationen.
 """
+import re
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict
 
+# Vollständiger Envelope im Body (ein Durchlauf für beide Prefixe)
+_ENVELOPE_MARKER_RE = re.compile(r'<(?:soap|SOAP-ENV):Envelope')
+
+# Feste Teile des Envelopes je SOAP-Version; nur Namespace und Body variieren
+_ENVELOPE_PREFIXES = {
+    version: f'<?xml version="1.0" encoding="utf-8"?>\n<soap:Envelope xmlns:soap="{uri}"'
+    for version, uri in (
+        ("1.1", "http://schemas.xmlsoap.org/soap/envelope/"),
+        ("1.2", "http://www.w3.org/2003/05/soap-envelope"),
+    )
+}
+_ENVELOPE_BODY_OPEN = '>\n    <soap:Body>\n        '
+_ENVELOPE_SUFFIX = '\n    </soap:Body>\n</soap:Envelope>'
+
 
 @dataclass
 class SoapRequest:
@@ -25,6 +40,10 @@ class SoapRequest:
     timeout: int = field(default=30)
     created_at: datetime = field(default_factory=datetime.now)
 
+    # Caches für encoded_body und get_soap_envelope (z.B. bei Retries)
+    _encoded_body: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _envelope: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validierung nach Initialisierung"""
         if not self.endpoint_url:
@@ -53,6 +72,17 @@ class SoapRequest:
                 content_type += f'; action="{self.soap_action}"'
             self.headers.setdefault("Content-Type", content_type)
 
+    @property
+    def encoded_body(self) -> bytes:
+        """
+        Body als UTF-8 bytes.
+        Wird pro Body-String nur einmal encodiert (z.B. bei Retries).
+        """
+        cached = self._encoded_body
+        if cached is None or cached[0] is not self.body:
+            cached = self._encoded_body = (self.body, self.body.encode('utf-8'))
+        return cached[1]
+
     def add_header(self, key: str, value: str) -> None:
         """Fügt einen benutzerdefinierten Header hinzu"""
         if not key or not value:
@@ -63,29 +93,24 @@ class SoapRequest:
         """
         Gibt den kompletten SOAP-Envelope zurück.
         Falls body bereits ein vollständiger Envelope ist, wird er zurückgegeben.
+        Das Ergebnis wird bis zur nächsten Änderung von body, namespace oder
+        soap_version zwischengespeichert (z.B. für Retries).
         """
-        # Prüfen ob Body bereits ein vollständiger SOAP Envelope ist
-        if "<soap:Envelope" in self.body or "<SOAP-ENV:Envelope" in self.body:
-            return self.body
-
-        # Sonst Envelope aufbauen
-        namespace_attr = f' xmlns:ns="{self.namespace}"' if self.namespace else ''
-
-        if self.soap_version == "1.1":
-            envelope = f'''<?xml version="1.0" encoding="utf-8"?>
-<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"{namespace_attr}>
-    <soap:Body>
-        {self.body}
-    </soap:Body>
-</soap:Envelope>'''
-        else:  # SOAP 1.2
-            envelope = f'''<?xml version="1.0" encoding="utf-8"?>
-<soap:Envelope xmlns:soap="http://www.w3.org/2003/05/soap-envelope"{namespace_attr}>
-    <soap:Body>
-        {self.body}
-    </soap:Body>
-</soap:Envelope>'''
+        body = self.body
+        cached = self._envelope
+        if (cached is not None and cached[0] is body
+                and cached[1] == self.namespace and cached[2] == self.soap_version):
+            return cached[3]
 
+        # Prüfen ob Body bereits ein vollständiger SOAP Envelope ist
+        if _ENVELOPE_MARKER_RE.search(body):
+            envelope = body
+        else:
+            namespace_attr = f' xmlns:ns="{self.namespace}"' if self.namespace else ''
+            prefix = _ENVELOPE_PREFIXES["1.1" if self.soap_version == "1.1" else "1.2"]
+            envelope = ''.join((prefix, namespace_attr, _ENVELOPE_BODY_OPEN, body, _ENVELOPE_SUFFIX))
+
+        self._envelope = (body, self.namespace, self.soap_version, envelope)
         return envelope
 
     def __eq__(self, other) -> bool:
@@ -3,29 +3,47 @@ Domain Entity: SoapResponse
 Repräsentiert die Antwort auf einen SOAP-Request.
 """
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, Dict, Any
 from datetime import datetime
-from enum import Enum
+import time
+from enum import IntEnum
 
 
-class ResponseStatus(Enum):
-    """Status der SOAP-Response"""
-    SUCCESS = "success"
-    SOAP_FAULT = "soap_fault"
-    HTTP_ERROR = "http_error"
-    NETWORK_ERROR = "network_error"
-    TIMEOUT = "timeout"
-    FAILURE = "failure"
-    ERROR = "error"
-    PARSING_ERROR = "parsing_error"
-    AUTH_ERROR = "auth_error"
+class ResponseStatus(IntEnum):
+    """
+    Status der SOAP-Response.
+    IntEnum für schnelle Vergleiche; nach außen wird name.lower() ausgegeben.
+    """
+    SUCCESS = 1
+    SOAP_FAULT = 2
+    HTTP_ERROR = 3
+    NETWORK_ERROR = 4
+    TIMEOUT = 5
+    FAILURE = 6
+    ERROR = 7
+    PARSING_ERROR = 8
+    AUTH_ERROR = 9
+
+
+# Differenz zwischen Wall-Clock und monotoner Uhr, um Zeitstempel bei Bedarf
+# in ein datetime umzurechnen
+_WALLCLOCK_OFFSET_NS = time.time_ns() - time.monotonic_ns()
 
+# Felder, die im Ansible-Result auch mit Wert None enthalten sind
+_RESULT_KEYS = frozenset(("changed", "request_id", "status", "status_code", "success"))
+_RESULT_KEYS_SUCCESS = _RESULT_KEYS | {"body"}
 
-@dataclass
+# HTTP-Status, bei denen der Server einen späteren Versuch erwartet
+_RETRYABLE_STATUS_CODES = frozenset((429, 503))
+
+
+@dataclass(frozen=True)
 class SoapResponse:
     """
     Entity für eine SOAP-Response.
     Kapselt alle Informationen über die Antwort eines SOAP-Requests.
+    Immutable - eine empfangene Response wird nicht mehr verändert.
     """
 
     request_id: str  # Referenz zum ursprünglichen Request
@@ -45,16 +63,31 @@ class SoapResponse:
 
     # Metadaten
     response_time_ms: Optional[float] = None
-    received_at: datetime = field(default_factory=datetime.now)
+    retry_after: Optional[float] = None  # Wartezeit laut Retry-After (Sekunden), falls gesendet
+    received_at_ns: int = field(default_factory=time.monotonic_ns)
 
     def __post_init__(self):
         """Validierung nach Initialisierung"""
         if not self.request_id:
             raise ValueError("request_id ist erforderlich")
 
+    @property
+    def received_at(self) -> datetime:
+        """Empfangszeitpunkt als datetime (nur bei Bedarf berechnet)"""
+        return datetime.fromtimestamp((self.received_at_ns + _WALLCLOCK_OFFSET_NS) / 1e9)
+
+    @cached_property
+    def _ok(self) -> bool:
+        """Erfolgsstatus, einmalig berechnet (Response ist immutable)"""
+        return self.status == ResponseStatus.SUCCESS and 200 <= (self.status_code or 0) < 300
+
     def is_successful(self) -> bool:
         """Prüft ob der Request erfolgreich war"""
-        return self.status == ResponseStatus.SUCCESS and 200 <= (self.status_code or 0) < 300
+        return self._ok
+
+    def is_retryable(self) -> bool:
+        """Prüft ob der Server überlastet ist und ein Retry sinnvoll ist (HTTP 429/503)"""
+        return self.status_code in _RETRYABLE_STATUS_CODES
 
     def has_soap_fault(self) -> bool:
         """Prüft ob eine SOAP Fault vorliegt"""
@@ -80,42 +113,35 @@ class SoapResponse:
             return f"SOAP Fault: {self.fault_code} - {self.fault_string}"
 
         if self.error_message:
-            return f"{self.status.value}: {self.error_message}"
+            return f"{self.status.name.lower()}: {self.error_message}"
 
-        return f"Error: {self.status.value}"
+        return f"Error: {self.status.name.lower()}"
 
     def to_ansible_result(self) -> Dict[str, Any]:
         """
         Konvertiert die Response in ein Ansible-kompatibles Result-Dictionary.
         Nützlich für die Presentation Layer.
         """
+        ok = self._ok
         result = {
             "changed": False,  # SOAP-Requests ändern normalerweise nichts an Ansible-Seite
             "request_id": self.request_id,
-            "status": self.status.value,
+            "status": self.status.name.lower(),
             "status_code": self.status_code,
-            "success": self.is_successful(),
+            "success": ok,
+            "response_time_ms": self.response_time_ms,
+            "body": self.body if ok else None,
+            "parsed_body": (self.parsed_body or None) if ok else None,
+            "failed": None if ok else True,
+            "msg": None if ok else self.get_error_summary(),
+            "fault": None if ok else self.get_fault_info(),
+            "error": None if ok else (self.error_message or None),
         }
 
-        if self.response_time_ms is not None:
-            result["response_time_ms"] = self.response_time_ms
-
-        if self.is_successful():
-            result["body"] = self.body
-            if self.parsed_body:
-                result["parsed_body"] = self.parsed_body
-        else:
-            result["failed"] = True
-            result["msg"] = self.get_error_summary()
-
-            if self.has_soap_fault():
-                result["fault"] = self.get_fault_info()
-
-            if self.error_message:
-                result["error"] = self.error_message
-
-        return result
+        # Optionale Felder ohne Wert weglassen
+        keep = _RESULT_KEYS_SUCCESS if ok else _RESULT_KEYS
+        return {k: v for k, v in result.items() if v is not None or k in keep}
 
     def __repr__(self) -> str:
         return (f"SoapResponse(request_id='{self.request_id}', "
-                f"status={self.status.value}, code={self.status_code})")
+                f"status={self.status.name.lower()}, code={self.status_code})")
@@ -107,3 +107,4 @@ class InvalidResponseError(SoapRepositoryError):
 class AuthenticationError(SoapRepositoryError):
     """Exception bei Authentifizierungsfehlern"""
     pass
+
@@ -3,7 +3,13 @@ Domain Service für SOAP-Operationen.
 Enthält Geschäftslogik, die nicht zu einer Entity gehört.
 """
 from typing import Optional, Dict, List
-from datetime import datetime, timedelta
+from collections import OrderedDict
+import hashlib
+import random
+import re
+import threading
+import time
+from datetime import timedelta
 from ..entities.soap_request import SoapRequest
 from ..entities.soap_response import SoapResponse, ResponseStatus
 from ..entities.endpoint import Endpoint
@@ -13,6 +19,14 @@ from ..value_objects.soap_envelope import SoapEnvelope, SoapVersion
 from ..repositories.soap_repository import SoapRepository, SoapRepositoryError
 
 
+# Operation-Namen in WSDL-Dokumenten
+_WSDL_OP_RE = re.compile(r'<operation[^>]*name="([^"]*)"')
+
+# Obergrenze für den Response-Cache und Intervall für den Ablauf-Sweep
+_MAX_CACHE_ENTRIES = 1024
+_CACHE_SWEEP_INTERVAL = 128
+
+
 class SoapService:
   """
   Domain Service für SOAP-Operationen.
@@ -25,8 +39,15 @@ class SoapService:
         repository: Repository-Implementierung für SOAP-Kommunikation
     """
     self._repository = repository
-    self._request_cache: Dict[str, SoapResponse] = {}
+    # LRU-Cache: älteste Einträge vorne, zuletzt genutzte hinten.
+    # Ablaufzeitpunkte (monotone ns) liegen getrennt, damit Prüfung und
+    # Sweep die Response-Objekte nicht anfassen müssen.
+    self._request_cache: 'OrderedDict[str, SoapResponse]' = OrderedDict()
+    self._cache_expiry: Dict[str, int] = {}
     self._cache_ttl = timedelta(minutes=5)
+    self._max_cache_entries = _MAX_CACHE_ENTRIES
+    self._cache_inserts = 0
+    self._cache_lock = threading.Lock()
 
   def execute_request(
       self,
@@ -56,23 +77,27 @@ class SoapService:
         ValueError: Bei ungültigen Parametern
         SoapRepositoryError: Bei Kommunikationsfehlern
     """
-    # Validierung
-    if not endpoint.supports_operation(action.value):
+    # Häufig genutzte Attribute einmalig lokal halten
+    action_value = action.value
+    url = endpoint.url
+    version_str = endpoint.soap_version
+
+    # Validierung (frozenset-Lookup im Endpoint)
+    if not endpoint.supports_operation(action_value):
       raise ValueError(
-        f"Operation '{action.value}' wird von Endpoint '{endpoint.name}' nicht unterstützt"
+        f"Operation '{action_value}' wird von Endpoint '{endpoint.name}' nicht unterstützt"
       )
 
-    # Cache-Key erstellen
-    cache_key = self._create_cache_key(endpoint.url, action.value, body_content)
-
-    # Cache prüfen
-    if use_cache and cache_key in self._request_cache:
-      cached_response = self._request_cache[cache_key]
-      if self._is_cache_valid(cached_response):
+    # Cache prüfen (Key nur berechnen, wenn der Cache genutzt wird)
+    cache_key = None
+    if use_cache:
+      cache_key = self._create_cache_key(url, action_value, body_content, namespace_declarations)
+      cached_response = self._cache_get(cache_key)
+      if cached_response is not None:
         return cached_response
 
     # SOAP Envelope erstellen
-    soap_version = SoapVersion.V1_1 if endpoint.soap_version == "1.1" else SoapVersion.V1_2
+    soap_version = SoapVersion.V1_1 if version_str == "1.1" else SoapVersion.V1_2
     envelope = SoapEnvelope.from_body(
       body_content,
       version=soap_version,
@@ -82,11 +107,11 @@ class SoapService:
 
     # Request erstellen
     request = SoapRequest(
-      endpoint_url=endpoint.url,
-      soap_action=action.value,
+      endpoint_url=url,
+      soap_action=action_value,
       body=envelope.build(),
       namespace=action.namespace,
-      soap_version=endpoint.soap_version,
+      soap_version=version_str,
       timeout=endpoint.default_timeout
     )
 
@@ -100,7 +125,7 @@ class SoapService:
 
     # In Cache speichern
     if use_cache and response.is_successful():
-      self._request_cache[cache_key] = response
+      self._cache_put(cache_key, response)
 
     return response
 
@@ -112,11 +137,16 @@ class SoapService:
       namespace_prefix: Optional[str] = None,
       namespace_declarations: Optional[Dict[str, str]] = None,
       max_retries: int = 3,
-      retry_delay_seconds: int = 1,
-      custom_headers: Optional[Dict[str, str]] = None
+      retry_delay_seconds: float = 1,
+      custom_headers: Optional[Dict[str, str]] = None,
+      max_retry_delay_seconds: float = 30
   ) -> SoapResponse:
     """
     Führt einen SOAP-Request mit Retry-Logik aus.
+    Wiederholt werden Repository-Fehler und Überlastungs-Responses
+    (HTTP 429/503). Wartezeiten folgen "Decorrelated Jitter", damit parallel
+    laufende Worker nicht gleichzeitig erneut anfragen. Ein vom Server
+    gemeldetes Retry-After hat Vorrang.
 
     Args:
         endpoint: Der Ziel-Endpoint
@@ -124,19 +154,20 @@ class SoapService:
         body_content: Der Body-Inhalt
         namespace_prefix: Optional Namespace-Prefix
         max_retries: Maximale Anzahl von Wiederholungen
-        retry_delay_seconds: Verzögerung zwischen Versuchen
+        retry_delay_seconds: Minimale Verzögerung zwischen Versuchen
         custom_headers: Optional zusätzliche Headers
+        max_retry_delay_seconds: Maximale Verzögerung zwischen Versuchen
 
     Returns:
         SoapResponse mit dem Ergebnis
     """
-    import time
 
     last_error = None
+    delay = retry_delay_seconds
 
     for attempt in range(max_retries + 1):
       try:
-        return self.execute_request(
+        response = self.execute_request(
           endpoint,
           action,
           body_content,
@@ -146,10 +177,21 @@ class SoapService:
         )
       except SoapRepositoryError as e:
         last_error = e
-        if attempt < max_retries:
-          time.sleep(retry_delay_seconds * (attempt + 1))  # Exponential backoff
-          continue
-        break
+        retry_after = None
+      else:
+        # Überlastung (429/503) wird wiederholt; beim letzten Versuch
+        # geht die Response mit Status, Headern und Body zurück
+        if attempt >= max_retries or not response.is_retryable():
+          return response
+        retry_after = response.retry_after
+
+      if attempt < max_retries:
+        if retry_after is not None:
+          delay = retry_after
+        else:
+          delay = random.uniform(retry_delay_seconds, delay * 3)
+        delay = min(max_retry_delay_seconds, delay)
+        time.sleep(delay)
 
     # Alle Versuche fehlgeschlagen
     raise SoapRepositoryError(
@@ -159,45 +201,64 @@ class SoapService:
   def batch_execute(
       self,
       endpoint: Endpoint,
-      requests: List[Dict[str, str]]
+      requests: List[Dict[str, str]],
+      max_workers: int = 8
   ) -> List[SoapResponse]:
     """
-    Führt mehrere SOAP-Requests nacheinander aus.
+    Führt mehrere SOAP-Requests parallel aus.
+    Die Requests teilen sich die Verbindungen des Repositories; die
+    Reihenfolge der Responses entspricht der Reihenfolge der Requests.
 
     Args:
         endpoint: Der Ziel-Endpoint
         requests: Liste von Dicts mit 'action' und 'body_content'
+        max_workers: Maximale Anzahl paralleler Requests (1 = sequenziell)
 
     Returns:
         Liste von SoapResponses
     """
-    responses = []
+    # Eingaben vorab validieren (Fehler hier brechen den Batch ab)
+    items = [
+      (SoapAction.from_string(req_data['action']), req_data['body_content'], req_data.get('namespace_prefix'))
+      for req_data in requests
+    ]
+    if not items:
+      return []
 
-    for req_data in requests:
-      action = SoapAction.from_string(req_data['action'])
-      body_content = req_data['body_content']
-      namespace_prefix = req_data.get('namespace_prefix')
+    workers = max(1, min(max_workers, len(items)))
+    if workers == 1:
+      return [self._execute_batch_item(endpoint, *item) for item in items]
 
-      try:
-        response = self.execute_request(
-          endpoint,
-          action,
-          body_content,
-          namespace_prefix=namespace_prefix
-        )
-        responses.append(response)
-      except Exception as e:
-        # Fehler-Response erstellen
-        error_response = SoapResponse(
-          request_id="batch-error",
-          status=ResponseStatus.ERROR,
-          status_code=0,
-          body=f"<error>{str(e)}</error>",
-          error_message=str(e)
-        )
-        responses.append(error_response)
+    # Erst hier importieren: Einzel-Requests brauchen keinen Thread-Pool
+    from concurrent.futures import ThreadPoolExecutor
 
-    return responses
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+      return list(executor.map(lambda item: self._execute_batch_item(endpoint, *item), items))
+
+  def _execute_batch_item(
+      self,
+      endpoint: Endpoint,
+      action: SoapAction,
+      body_content: str,
+      namespace_prefix: Optional[str]
+  ) -> SoapResponse:
+    """Führt einen einzelnen Batch-Request aus; Fehler werden zur Fehler-Response"""
+    try:
+      return self.execute_request(
+        endpoint,
+        action,
+        body_content,
+        namespace_prefix=namespace_prefix
+      )
+    except Exception as e:
+      # Fehler-Response erstellen
+      return SoapResponse(
+        request_id="batch-error",
+        status=ResponseStatus.ERROR,
+        status_code=0,
+        body=f"<error>{str(e)}</error>",
+        error_message=str(e)
+      )
 
   def validate_endpoint_connectivity(self, endpoint: Endpoint) -> bool:
     """
@@ -255,6 +316,15 @@ class SoapService:
 
     xml_body = XmlBody.from_string(response.body)
 
+    # Schneller Pfad: nur ein Wert gesucht → direkt im geparsten Baum suchen,
+    # ohne Body-Inhalt zu serialisieren oder ein Dictionary aufzubauen
+    if extract_xpath and not strip_namespaces:
+      return {
+        "success": True,
+        "data": xml_body.find_element(extract_xpath, in_body=True),
+        "xpath": extract_xpath
+      }
+
     # Namespaces entfernen wenn gewünscht
     if strip_namespaces:
       xml_body = xml_body.strip_namespaces()
@@ -316,28 +386,107 @@ class SoapService:
 
     return xml1 == xml2
 
-  def _create_cache_key(self, url: str, action: str, body: str) -> str:
-    """Erstellt einen Cache-Key aus Request-Parametern"""
-    import hashlib
-    key_string = f"{url}:{action}:{body}"
-    return hashlib.sha256(key_string.encode()).hexdigest()
+  def _create_cache_key(
+      self,
+      url: str,
+      action: str,
+      body,
+      namespace_declarations: Optional[Dict[str, str]] = None
+  ) -> str:
+    """
+    Erstellt einen Cache-Key aus Request-Parametern.
+    Der Cache ist prozesslokal, daher reicht ein kurzer BLAKE2b-Digest.
+    Die Teile werden einzeln in den Hash gespeist, ohne den (evtl. großen)
+    Body in einen zusammengesetzten String zu kopieren. Namespace-
+    Deklarationen landen im Envelope und gehören deshalb mit in den Key.
+    """
+    key_hash = hashlib.blake2b(digest_size=16)
+    key_hash.update(url.encode('utf-8'))
+    key_hash.update(b':')
+    key_hash.update(action.encode('utf-8'))
+    key_hash.update(b':')
+    if namespace_declarations:
+      for prefix, uri in sorted(namespace_declarations.items()):
+        key_hash.update(f'{prefix}={uri};'.encode('utf-8'))
+    key_hash.update(b':')
+    if isinstance(body, str):
+      key_hash.update(body.encode('utf-8'))
+    else:
+      key_hash.update(memoryview(body))
+    return key_hash.hexdigest()
+
+  def _cache_get(self, cache_key: str) -> Optional[SoapResponse]:
+    """Liefert eine gültige Response aus dem Cache (abgelaufene werden entfernt)"""
+    with self._cache_lock:
+      response = self._request_cache.get(cache_key)
+      if response is None:
+        return None
+
+      if not self._is_cache_valid(cache_key):
+        self._cache_evict(cache_key)
+        return None
+
+      self._request_cache.move_to_end(cache_key)
+      return response
+
+  def _cache_put(self, cache_key: str, response: SoapResponse) -> None:
+    """Speichert eine Response im Cache und verdrängt bei Bedarf die älteste"""
+    with self._cache_lock:
+      self._request_cache[cache_key] = response
+      self._request_cache.move_to_end(cache_key)
+      # Ablaufzeitpunkt einmalig beim Einfügen berechnen
+      self._cache_expiry[cache_key] = response.received_at_ns + int(self._cache_ttl.total_seconds() * 1e9)
+
+      if len(self._request_cache) > self._max_cache_entries:
+        oldest_key, _ = self._request_cache.popitem(last=False)
+        del self._cache_expiry[oldest_key]
+
+      # Regelmäßig abgelaufene Einträge entfernen
+      self._cache_inserts += 1
+      if self._cache_inserts % _CACHE_SWEEP_INTERVAL == 0:
+        self._sweep_cache()
+
+  def _cache_evict(self, cache_key: str) -> None:
+    """Entfernt einen Eintrag aus Response- und Ablauf-Tabelle"""
+    del self._request_cache[cache_key]
+    del self._cache_expiry[cache_key]
 
-  def _is_cache_valid(self, response: SoapResponse) -> bool:
+  def _sweep_cache(self) -> None:
+    """
+    Entfernt alle abgelaufenen Einträge aus dem Cache (Lock wird vom Aufrufer gehalten).
+    Läuft nur über die Ablauf-Tabelle, ohne die Responses anzufassen.
+    """
+    now = time.monotonic_ns()
+    expired = [key for key, expires_at in self._cache_expiry.items() if expires_at <= now]
+    for key in expired:
+      self._cache_evict(key)
+
+  def _is_cache_valid(self, cache_key: str) -> bool:
     """Prüft ob ein gecachtes Response noch gültig ist"""
-    age = datetime.now() - response.received_at
-    return age < self._cache_ttl
+    return self._cache_expiry.get(cache_key, 0) > time.monotonic_ns()
 
   def _parse_operations_from_wsdl(self, wsdl_content: str) -> List[str]:
     """
-    Extrahiert Operation-Namen aus WSDL.
+    Extrahiert Operation-Namen aus WSDL (Reihenfolge des Dokuments, ohne Duplikate).
     Vereinfachte Implementierung.
     """
-    import re
-
-    # Suche nach operation-Tags
-    operations = re.findall(r'<operation[^>]*name="([^"]*)"', wsdl_content)
-    return list(set(operations))  # Duplikate entfernen
+    # Alle Operationen sind in den portType-Abschnitten deklariert; danach
+    # folgende Bindings wiederholen nur deren Namen
+    end = wsdl_content.rfind('portType>')
+    if end < 0:
+      end = len(wsdl_content)
+
+    seen = set()
+    operations = []
+    for match in _WSDL_OP_RE.finditer(wsdl_content, 0, end):
+      name = match.group(1)
+      if name not in seen:
+        seen.add(name)
+        operations.append(name)
+    return operations
 
   def clear_cache(self) -> None:
     """Leert den Response-Cache"""
-    self._request_cache.clear()
+    with self._cache_lock:
+      self._request_cache.clear()
+      self._cache_expiry.clear()
@@ -6,6 +6,18 @@ from dataclasses import dataclass
 from typing import Optional
 import re
 
+# URI-Muster für is_uri (einmalig kompiliert)
+_URI_RE = re.compile(
+    r'^https?://'  # http:// oder https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+# Beliebiger Whitespace (Prüfung in C statt Python-Schleife)
+_WS_SEARCH = re.compile(r'\s').search
+
 
 @dataclass(frozen=True)
 class SoapAction:
@@ -23,7 +35,7 @@ class SoapAction:
         #     raise ValueError("SOAP Action darf nicht leer sein")
 
         # Action sollte keine Whitespaces enthalten
-        if any(c.isspace() for c in self.value):
+        if _WS_SEARCH(self.value):
             raise ValueError(f"SOAP Action darf keine Leerzeichen enthalten: {self.value}")
 
     @classmethod
@@ -57,14 +69,7 @@ class SoapAction:
 
     def is_uri(self) -> bool:
         """Prüft ob die Action eine URI ist"""
-        uri_pattern = re.compile(
-            r'^https?://'  # http:// oder https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        return bool(uri_pattern.match(self.value))
+        return bool(_URI_RE.match(self.value))
 
     def to_header_value(self, soap_version: str = "1.1") -> str:
         """
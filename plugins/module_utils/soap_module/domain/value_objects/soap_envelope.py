@@ -2,10 +2,24 @@
 Value Object: SoapEnvelope
 Spezialisiertes Value Object für komplette SOAP Envelopes.
 """
-from dataclasses import dataclass
-from typing import Optional, Dict
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Tuple
 from enum import Enum
-import xml.etree.ElementTree as ET
+from functools import lru_cache
+from xml.sax.saxutils import quoteattr
+import re
+
+from .xml_body import parse_xml
+
+# Führende XML-Deklaration in eingebettetem Content
+_XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>\s*')
+
+
+def _strip_declaration(content: str) -> str:
+    """Entfernt eine XML-Deklaration, die im Envelope ungültig wäre"""
+    if content.lstrip().startswith('<?xml'):
+        return _XML_DECLARATION_RE.sub('', content, count=1)
+    return content
 
 class SoapVersion(Enum):
     """SOAP Version Enumeration"""
@@ -24,6 +38,45 @@ class SoapVersion(Enum):
         """Standard-Prefix für die SOAP-Version"""
         return "soap"
 
+
+# Vorberechnete Envelope-Bausteine je Version: (Envelope-Start ohne ">", Body-Start, Ende)
+_ENVELOPE_PARTS = {
+    version: (
+        f'<?xml version="1.0" encoding="utf-8"?>\n'
+        f'<{version.prefix}:Envelope xmlns:{version.prefix}="{version.namespace}"',
+        f'<{version.prefix}:Body>',
+        f'</{version.prefix}:Body></{version.prefix}:Envelope>',
+    )
+    for version in SoapVersion
+}
+
+
+@lru_cache(maxsize=64)
+def _envelope_frame(
+        version: SoapVersion,
+        namespace_items: Tuple[Tuple[str, str], ...] = (),
+        header_content: Optional[str] = None
+) -> Tuple[str, str]:
+    """
+    Liefert (Prefix, Suffix) des Envelopes rund um den Body-Content.
+    Bei gleicher Version/Namespaces/Header ist das Gerüst identisch und
+    wird daher nur einmal gebaut.
+    """
+    envelope_open, body_open, envelope_close = _ENVELOPE_PARTS[version]
+
+    prefix = version.prefix
+    extra_ns = ''.join(
+        f' xmlns:{ns_prefix}={quoteattr(uri)}' if ns_prefix else f' xmlns={quoteattr(uri)}'
+        for ns_prefix, uri in namespace_items
+        if ns_prefix != prefix
+    )
+    header = (
+        f'<{prefix}:Header>{_strip_declaration(header_content)}</{prefix}:Header>'
+        if header_content else ''
+    )
+
+    return f'{envelope_open}{extra_ns}>{header}{body_open}', envelope_close
+
 @dataclass(frozen=True)
 class SoapEnvelope:
     """
@@ -37,24 +90,60 @@ class SoapEnvelope:
     namespace_declarations: Optional[Dict[str, str]] = None
     namespace_prefix: Optional[str] = None  # ← NEU! Custom Prefix für Body-Content
 
+    # Gebauter Envelope (wird beim ersten build() gesetzt)
+    _built: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validierung bei Erstellung"""
-        if not self.body_content:
+        self._validate(self.body_content, self.header_content)
+
+    @staticmethod
+    def _validate(
+            body_content: str,
+            header_content: Optional[str] = None,
+            check_xml: bool = True
+    ) -> None:
+        """
+        Prüft Body und Header (falls vorhanden) auf valides XML.
+        Mit check_xml=False wird nur auf leeren Body geprüft.
+
+        Raises:
+            ValueError: Bei leerem oder ungültigem Body/Header
+        """
+        if not body_content:
             raise ValueError("Body-Content darf nicht leer sein")
 
+        if not check_xml:
+            return
+
         # Body-Content sollte valides XML sein
         try:
-            ET.fromstring(self.body_content)
-        except ET.ParseError as e:
+            parse_xml(body_content)
+        except ValueError as e:
             raise ValueError(f"Body-Content ist kein valides XML: {e}")
 
         # Header validieren falls vorhanden
-        if self.header_content:
+        if header_content:
             try:
-                ET.fromstring(self.header_content)
-            except ET.ParseError as e:
+                parse_xml(header_content)
+            except ValueError as e:
                 raise ValueError(f"Header-Content ist kein valides XML: {e}")
 
+    @staticmethod
+    def _assemble(
+            body_content: str,
+            version: SoapVersion,
+            namespace_declarations: Optional[Dict[str, str]] = None,
+            header_content: Optional[str] = None
+    ) -> str:
+        """
+        Setzt den Envelope aus dem (gecachten) Gerüst der SOAP-Version
+        zusammen. Body und Header werden unverändert eingesetzt.
+        """
+        namespace_items = tuple(namespace_declarations.items()) if namespace_declarations else ()
+        prefix, suffix = _envelope_frame(version, namespace_items, header_content or None)
+        return f'{prefix}{_strip_declaration(body_content)}{suffix}'
+
     @classmethod
     def from_body(
             cls,
@@ -79,50 +168,46 @@ class SoapEnvelope:
             namespace_prefix=namespace_prefix
         )
 
-    def build(self) -> str:
-        """
-        Baut den kompletten SOAP Envelope mit ElementTree.
-        Berücksichtigt dabei den namespace_prefix falls vorhanden.
+    @staticmethod
+    def wrap(
+            body_content: str,
+            version: SoapVersion = SoapVersion.V1_1,
+            namespace_declarations: Optional[Dict[str, str]] = None,
+            header_content: Optional[str] = None,
+            validate: bool = True
+    ) -> str:
         """
+        Baut den Envelope-String direkt, ohne Zwischenobjekte.
+        Entspricht from_body(...).with_namespace(...).build(), validiert
+        den Body aber nur einmal. Mit validate=False entfällt die
+        XML-Prüfung (z.B. für selbst erzeugtes XML).
 
-        # SOAP Envelope Namespace
-        soap_ns = self.version.namespace
-        ET.register_namespace('soap', soap_ns)
-
-        # Zusätzliche Namespaces registrieren
-        if self.namespace_declarations:
-            for prefix, uri in self.namespace_declarations.items():
-                ET.register_namespace(prefix if prefix else '', uri)
-
-        # Falls namespace_prefix angegeben, auch diesen registrieren
-        if self.namespace_prefix and self.namespace_declarations:
-            # Suche nach dem Namespace für den Prefix
-            for prefix, uri in self.namespace_declarations.items():
-                if prefix == self.namespace_prefix:
-                    ET.register_namespace(prefix, uri)
-                    break
-
-        # Root Element
-        envelope = ET.Element(f'{{{soap_ns}}}Envelope')
-
-        # Header falls vorhanden
-        if self.header_content:
-            header = ET.SubElement(envelope, f'{{{soap_ns}}}Header')
-            header_element = ET.fromstring(self.header_content)
-            header.append(header_element)
-
-        # Body
-        body = ET.SubElement(envelope, f'{{{soap_ns}}}Body')
+        Raises:
+            ValueError: Bei leerem oder ungültigem Body/Header
+        """
+        SoapEnvelope._validate(body_content, header_content, check_xml=validate)
+        return SoapEnvelope._assemble(body_content, version, namespace_declarations, header_content)
 
-        # Body Content parsen und direkt anhängen
-        try:
-            body_element = ET.fromstring(self.body_content)
-            body.append(body_element)
-        except ET.ParseError as e:
-            raise ValueError(f"Ungültiger XML Body Content: {e}")
+    def build(self) -> str:
+        """
+        Gibt den kompletten SOAP Envelope zurück.
+        Der Envelope ist immutable und wird daher nur einmal gebaut.
+        """
+        if self._built is None:
+            object.__setattr__(self, '_built', self._build_internal())
+        return self._built
 
-        xml_str = ET.tostring(envelope, encoding='unicode', method='xml')
-        return f'<?xml version="1.0" encoding="utf-8"?>\n{xml_str}'
+    def _build_internal(self) -> str:
+        """
+        Baut den kompletten SOAP Envelope. Body und Header sind bereits
+        in __post_init__ validiert.
+        """
+        return self._assemble(
+            self.body_content,
+            self.version,
+            self.namespace_declarations,
+            self.header_content
+        )
 
     def with_header(self, header_content: str) -> 'SoapEnvelope':
         """Gibt einen neuen Envelope mit Header zurück"""
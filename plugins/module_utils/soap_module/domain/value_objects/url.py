@@ -2,9 +2,9 @@
 Value Object: URL
 Repräsentiert eine validierte URL mit zusätzlicher Funktionalität.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict
-from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, ParseResult
 
 
 @dataclass(frozen=True)
@@ -16,12 +16,16 @@ class Url:
 
     value: str
 
+    # Einmalig geparste URL (wird in __post_init__ gesetzt)
+    _parsed: Optional[ParseResult] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validierung bei Erstellung"""
         if not self.value:
             raise ValueError("URL darf nicht leer sein")
 
         parsed = urlparse(self.value)
+        object.__setattr__(self, '_parsed', parsed)
 
         if not parsed.scheme:
             raise ValueError(f"URL muss ein Schema haben: {self.value}")
@@ -49,32 +53,32 @@ class Url:
 
     def get_scheme(self) -> str:
         """Gibt das URL-Schema zurück (http/https)"""
-        return urlparse(self.value).scheme
+        return self._parsed.scheme
 
     def get_host(self) -> str:
         """Gibt den Hostnamen zurück"""
-        return urlparse(self.value).netloc
+        return self._parsed.netloc
 
     def get_path(self) -> str:
         """Gibt den Pfad zurück"""
-        return urlparse(self.value).path or "/"
+        return self._parsed.path or "/"
 
     def get_query_params(self) -> Dict[str, list]:
         """Gibt die Query-Parameter als Dictionary zurück"""
-        return parse_qs(urlparse(self.value).query)
+        return parse_qs(self._parsed.query)
 
     def get_base_url(self) -> str:
         """Gibt die Basis-URL ohne Query-Parameter zurück"""
-        parsed = urlparse(self.value)
+        parsed = self._parsed
         return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
 
     def is_secure(self) -> bool:
         """Prüft ob HTTPS verwendet wird"""
-        return self.get_scheme() == "https"
+        return self._parsed.scheme == "https"
 
     def with_path(self, path: str) -> 'Url':
         """Gibt eine neue URL mit geändertem Pfad zurück"""
-        parsed = urlparse(self.value)
+        parsed = self._parsed
         new_url = urlunparse((
             parsed.scheme,
             parsed.netloc,
@@ -87,7 +91,7 @@ class Url:
 
     def with_query_params(self, params: Dict[str, str]) -> 'Url':
         """Gibt eine neue URL mit zusätzlichen Query-Parametern zurück"""
-        parsed = urlparse(self.value)
+        parsed = self._parsed
         existing_params = parse_qs(parsed.query)
 
         # Merge parameters
@@ -1,20 +1,339 @@
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Union
+import copy
+import io
+import re
 import xml.etree.ElementTree as ET
 
+try:
+  from lxml import etree as _lxml_etree
+
+  # Ein Parser für alle Aufrufe; keine Entity-Auflösung (XXE)
+  _LXML_PARSER = _lxml_etree.XMLParser(
+    remove_blank_text=False,
+    huge_tree=False,
+    resolve_entities=False
+  )
+  HAS_LXML = True
+except ImportError:
+  _lxml_etree = None
+  _LXML_PARSER = None
+  HAS_LXML = False
+
+
+# XML-Deklaration am Dokumentanfang
+_XML_DECLARATION_RE = re.compile(r'\s*<\?xml\s[^>]*\?>')
+
+
+def parse_xml(xml_string: Union[str, bytes]):
+  """
+  Parst einen XML-String (oder bytes) zu einem Element.
+  Nutzt lxml (libxml2) falls verfügbar, sonst ElementTree.
+
+  Ein str ist bereits dekodiert und wird ohne erneutes Encoding geparst;
+  eine encoding-Angabe in der XML-Deklaration gilt nur für bytes.
+
+  Raises:
+      ValueError: Bei ungültigem XML
+  """
+  if HAS_LXML:
+    if isinstance(xml_string, str):
+      # lxml lehnt str mit encoding-Deklaration ab
+      declaration = _XML_DECLARATION_RE.match(xml_string)
+      if declaration:
+        xml_string = xml_string[declaration.end():]
+    try:
+      return _lxml_etree.fromstring(xml_string, parser=_LXML_PARSER)
+    except _lxml_etree.XMLSyntaxError as e:
+      raise ValueError(str(e))
+
+  try:
+    return ET.fromstring(xml_string)
+  except ET.ParseError as e:
+    raise ValueError(str(e))
+
+
+# Envelope-Tag mit beliebigem (oder ohne) Prefix, z.B. soap:, soapenv:, SOAP-ENV:
+_SOAP_ENVELOPE_RE = re.compile(r'<(?:[\w.-]+:)?envelope[\s>/]', re.IGNORECASE)
+# Der Envelope steht am Dokumentanfang; nur dieser Bereich wird durchsucht
+_SOAP_ENVELOPE_SCAN_LIMIT = 4096
+
+# SOAP Envelope Namespaces (1.1 und 1.2)
+_SOAP_NAMESPACES = (
+  'http://schemas.xmlsoap.org/soap/envelope/',
+  'http://www.w3.org/2003/05/soap-envelope',
+)
+
+if HAS_LXML:
+  # Vorkompilierte Abfragen für das erste Kind-Element im SOAP Body
+  # (zuletzt ohne Namespace, z.B. nach strip_namespaces)
+  _SOAP_BODY_XPATHS = tuple(
+    _lxml_etree.ETXPath(f'.//{{{namespace}}}Body/*[1]') for namespace in _SOAP_NAMESPACES
+  ) + (_lxml_etree.ETXPath('.//Body/*[1]'),)
+
+
+@lru_cache(maxsize=256)
+def _compiled_xpath(path: str):
+  """
+  Kompiliert einen Pfad einmalig zu einem lxml-XPath-Objekt.
+  ETXPath versteht auch die {namespace}tag-Notation von ElementPath.
+  Ohne Smart-Strings sind String-Ergebnisse einfache str ohne Referenz
+  auf den Baum.
+  Gibt None zurück, wenn der Pfad kein gültiger XPath-Ausdruck ist.
+  """
+  try:
+    return _lxml_etree.ETXPath(path, smart_strings=False)
+  except _lxml_etree.XPathSyntaxError:
+    return None
+
+
+def _local_name(tag: str) -> str:
+  """Entfernt den Namespace aus einem Tag-Namen"""
+  return tag.split('}', 1)[1] if '}' in tag else tag
+
+
+def _element_to_string(element) -> str:
+  """Serialisiert ein Element ohne nachfolgenden Tail-Text"""
+  if HAS_LXML:
+    return _lxml_etree.tostring(element, encoding='unicode', with_tail=False)
+
+  tail, element.tail = element.tail, None
+  try:
+    return ET.tostring(element, encoding='unicode')
+  finally:
+    element.tail = tail
+
+
+def _element_to_dict(element) -> Any:
+  """Konvertiert ein Element rekursiv zu Dictionary (Tags ohne Namespace)"""
+  result: Dict[str, Any] = {}
+
+  if element.attrib:
+    result['@attributes'] = dict(element.attrib)
+
+  if element.text and element.text.strip():
+    result['#text'] = element.text.strip()
+
+  for child in element:
+    if not isinstance(child.tag, str):
+      continue  # Kommentare / Processing Instructions
+
+    tag = _local_name(child.tag)
+    child_data = _element_to_dict(child)
+
+    if tag in result:
+      if not isinstance(result[tag], list):
+        result[tag] = [result[tag]]
+      result[tag].append(child_data)
+    else:
+      result[tag] = child_data
+
+  # Nur Text → direkt Text zurückgeben
+  if len(result) == 1 and '#text' in result:
+    return result['#text']
+
+  return result or None
+
 
 class XmlBody:
+  # Feste Attribute ohne Instanz-__dict__ (wird pro Request/Response erzeugt)
+  __slots__ = ('value', '_root', '_minified')
+
   def __init__(self, value: str):
     self.value = value
+    # Geparster Baum und minifizierte Form, werden beim ersten Zugriff gesetzt
+    self._root = None
+    self._minified = None
+
+  def __getstate__(self):
+    # Geparsten Baum nicht pickeln, wird bei Bedarf neu geparst
+    return {'value': self.value, '_minified': self._minified}
+
+  def __setstate__(self, state):
+    self.value = state['value']
+    self._minified = state.get('_minified')
+    self._root = None
 
   def __len__(self):
     return len(self.value or "")
 
+  def __eq__(self, other) -> bool:
+    """Inhaltliche Gleichheit (Whitespace zwischen Elementen wird ignoriert)"""
+    if self is other:
+      return True
+    if not isinstance(other, XmlBody):
+      return False
+    if self.value == other.value:
+      return True
+    return self._minified_value() == other._minified_value()
+
+  def __hash__(self) -> int:
+    return hash(self._minified_value())
+
+  def _minified_value(self) -> str:
+    """Minifizierte Form für Vergleiche (einmalig berechnet, bei ungültigem XML der Rohwert)"""
+    if self._minified is None:
+      try:
+        self._minified = self.minify().value
+      except ValueError:
+        self._minified = self.value or ""
+    return self._minified
+
+  def minify(self) -> 'XmlBody':
+    """Gibt ein neues XmlBody ohne Whitespace zwischen Elementen zurück"""
+    root = copy.deepcopy(self.get_root_element())
+
+    for element in root.iter():
+      if element.text is not None and not element.text.strip():
+        element.text = None
+      if element.tail is not None and not element.tail.strip():
+        element.tail = None
+
+    minified = XmlBody._from_element(root)
+    minified._minified = minified.value
+    return minified
+
   def is_soap_envelope(self) -> bool:
-    # lightweight check to see if content contains SOAP Envelope tag
+    # lightweight check to see if content starts with a SOAP Envelope tag
     if not self.value:
       return False
-    content = self.value.lower()
-    return ("<soap:envelope" in content) or ("<envelope" in content)
+    return _SOAP_ENVELOPE_RE.search(self.value, 0, _SOAP_ENVELOPE_SCAN_LIMIT) is not None
+
+  def get_root_element(self):
+    """
+    Gibt das Root-Element des geparsten XML zurück.
+    Das XML wird nur einmal geparst, alle Accessoren teilen sich den Baum.
+
+    Raises:
+        ValueError: Bei ungültigem XML
+    """
+    if self._root is None:
+      if not self.value:
+        raise ValueError("XML ist leer")
+      self._root = parse_xml(self.value)
+    return self._root
+
+  def get_root_tag(self) -> str:
+    """Gibt den Tag-Namen des Root-Elements zurück (ohne Namespace)"""
+    return _local_name(self.get_root_element().tag)
+
+  def get_namespaces(self) -> Dict[str, str]:
+    """Gibt alle deklarierten Namespaces zurück (Prefix -> URI)"""
+    if HAS_LXML:
+      namespaces = {}
+      for element in self.get_root_element().iter():
+        for prefix, uri in element.nsmap.items():
+          namespaces.setdefault(prefix or '', uri)
+      return namespaces
+
+    self.get_root_element()  # Validiert das XML
+    return {
+      prefix: uri
+      for _, (prefix, uri) in ET.iterparse(io.StringIO(self.value), events=('start-ns',))
+    }
+
+  def find_element(self, xpath: str, in_body: bool = False) -> Optional[str]:
+    """
+    Sucht ein Element via XPath/ElementPath und gibt dessen Text zurück.
+    Mit lxml werden Pfade einmalig kompiliert und in C ausgewertet.
+
+    Args:
+        xpath: Pfad-Ausdruck
+        in_body: Relativ zum Inhalt des SOAP Body suchen (falls vorhanden),
+                 ohne diesen vorher als eigenes XmlBody zu serialisieren
+
+    Returns:
+        Text des Elements oder None
+    """
+    root = None
+    if in_body:
+      root = self._get_body_element()
+    if root is None:
+      root = self.get_root_element()
+
+    compiled = _compiled_xpath(xpath) if HAS_LXML else None
+    if compiled is not None:
+      results = compiled(root)
+      if not isinstance(results, list):
+        return str(results)  # z.B. count(...) oder string(...)
+      if not results:
+        return None
+      found = results[0]
+      if isinstance(found, str):
+        return found.strip() or None  # text() oder @attribut
+    else:
+      found = root.find(xpath)
+      if found is None:
+        return None
+
+    if found.text:
+      return found.text.strip()
+    return None
+
+  def extract_body_content(self) -> Optional['XmlBody']:
+    """Gibt den Inhalt des SOAP Body (erstes Kind-Element) zurück"""
+    element = self._get_body_element()
+    if element is None:
+      return None
+    return self._from_element(element)
+
+  def _get_body_element(self):
+    """Erstes Kind-Element im SOAP Body oder None"""
+    root = self.get_root_element()
+
+    if HAS_LXML:
+      for body_xpath in _SOAP_BODY_XPATHS:
+        children = body_xpath(root)
+        if children:
+          return children[0]
+      return None
+
+    for body_path in [f'.//{{{namespace}}}Body' for namespace in _SOAP_NAMESPACES] + ['.//Body']:
+      body = root.find(body_path)
+      if body is not None:
+        for child in body:
+          if isinstance(child.tag, str):
+            return child
+
+    return None
+
+  @staticmethod
+  def _from_element(element) -> 'XmlBody':
+    """Erstellt ein XmlBody aus einem bereits geparsten Element"""
+    content = XmlBody(_element_to_string(element))
+    content._root = element
+    return content
+
+  def strip_namespaces(self) -> 'XmlBody':
+    """
+    Gibt ein neues XmlBody ohne Namespaces zurück.
+    Ein Durchlauf über den Baum statt String-Ersetzungen; der gecachte
+    Baum dieser Instanz bleibt unverändert.
+    """
+    root = copy.deepcopy(self.get_root_element())
+
+    for element in root.iter():
+      if not isinstance(element.tag, str):
+        continue
+      if '}' in element.tag:
+        element.tag = element.tag.split('}', 1)[1]
+      if any('}' in key for key in element.attrib):
+        attrib = {_local_name(key): value for key, value in element.attrib.items()}
+        element.attrib.clear()
+        element.attrib.update(attrib)
+
+    if HAS_LXML:
+      # Ungenutzte xmlns-Deklarationen einmalig am Ende entfernen
+      _lxml_etree.cleanup_namespaces(root)
+
+    stripped = XmlBody(_element_to_string(root))
+    stripped._root = root
+    return stripped
+
+  def to_dict(self) -> Dict[str, Any]:
+    """Konvertiert das XML zu Dictionary (Root-Tag als einziger Key)"""
+    root = self.get_root_element()
+    return {_local_name(root.tag): _element_to_dict(root)}
 
   @classmethod
   def from_dict(
@@ -135,7 +454,18 @@ class XmlBody:
     return self.value
 
   def to_pretty_string(self) -> str:
-    """Gibt formatierten XML-String zurück"""
+    """
+    Gibt formatierten XML-String zurück.
+    Mit lxml wird der gecachte Baum direkt von libxml2 serialisiert.
+    """
+    if HAS_LXML:
+      try:
+        root = copy.deepcopy(self.get_root_element())
+      except ValueError:
+        return self.value
+      _lxml_etree.indent(root, space="  ")
+      return _lxml_etree.tostring(root, pretty_print=True, encoding='unicode')
+
     try:
       import xml.dom.minidom
       dom = xml.dom.minidom.parseString(self.value)
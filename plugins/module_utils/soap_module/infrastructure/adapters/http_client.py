@@ -2,21 +2,153 @@
 HTTP Client Adapter für SOAP-Kommunikation.
 Abstrahiert die HTTP-Bibliothek (requests, urllib3, etc.)
 """
-from typing import Optional, Dict, Any
+from base64 import b64encode
+from typing import Optional, Dict, Any, Mapping, Tuple, Union
 from dataclasses import dataclass
+from functools import cached_property
 import requests
-from requests.auth import HTTPBasicAuth, HTTPDigestAuth
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase, HTTPDigestAuth
 from requests_ntlm import HttpNtlmAuth
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.poolmanager import PoolManager
+from urllib3.util.retry import Retry
+import re
+import ssl
+import threading
 import warnings
+from time import perf_counter
+
+
+class _ResumingSSLContext(ssl.SSLContext):
+    """
+    SSLContext, das die letzte TLS-Session pro (Host, Port) merkt und bei
+    neuen Verbindungen zur Wiederaufnahme anbietet (spart einen Round-Trip
+    und die asymmetrische Kryptografie des vollen Handshakes).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._tls_sessions: Dict[Tuple[str, int], ssl.SSLSession] = {}
+
+    def wrap_socket(self, sock, *args, **kwargs):
+        server_hostname = kwargs.get('server_hostname')
+        key = (server_hostname, sock.getpeername()[1]) if server_hostname else None
+        if key and kwargs.get('session') is None:
+            kwargs['session'] = self._tls_sessions.get(key)
+
+        ssl_sock = super().wrap_socket(sock, *args, **kwargs)
+
+        if key and ssl_sock.session is not None:
+            self._tls_sessions[key] = ssl_sock.session
+        return ssl_sock
+
+
+def _create_ssl_context(verify_ssl: bool) -> ssl.SSLContext:
+    """Erstellt das SSLContext-Objekt für einen HTTPS-Pool"""
+    context = _ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    # Hostname prüft urllib3 selbst; verify_mode setzt urllib3 pro Verbindung
+    context.check_hostname = False
+    if not verify_ssl:
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+class _TlsResumptionPoolManager(PoolManager):
+    """
+    PoolManager, der jedem HTTPS-Pool ein eigenes SSLContext gibt.
+    Pools sind nach Host, Port und Client-Zertifikat getrennt; so landet
+    die von urllib3 geladene Zertifikatskette nie bei einem anderen Pool.
+    """
+
+    def __init__(self, verify_ssl: bool, *args, **kwargs):
+        self._verify_ssl = verify_ssl
+        super().__init__(*args, **kwargs)
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        if scheme == 'https':
+            if request_context is None:
+                request_context = self.connection_pool_kw.copy()
+            if request_context.get('ssl_context') is None:
+                request_context['ssl_context'] = _create_ssl_context(self._verify_ssl)
+        return super()._new_pool(scheme, host, port, request_context)
+
+
+class _TlsResumptionAdapter(HTTPAdapter):
+    """HTTPAdapter mit SSLContext (und damit TLS-Session-Cache) pro Pool"""
+
+    def __init__(self, verify_ssl: bool, **kwargs):
+        self._verify_ssl = verify_ssl
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _TlsResumptionPoolManager(
+            self._verify_ssl,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs
+        )
+
+
+# charset-Parameter aus dem Content-Type
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+
+def _response_encoding(response) -> str:
+    """
+    Zeichensatz aus dem charset im Content-Type, sonst UTF-8 (XML-Standard).
+    Umgeht die teure Zeichensatz-Erkennung von response.text.
+    """
+    match = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    return match.group(1) if match else 'utf-8'
+
+
+class _PrecomputedBasicAuth(AuthBase):
+    """Basic-Auth mit einmalig berechnetem Authorization-Header"""
+
+    def __init__(self, username: str, password: str):
+        credentials = f'{username}:{password}'.encode('utf-8')
+        self._header = 'Basic ' + b64encode(credentials).decode('ascii')
+
+    def __call__(self, r):
+        r.headers['Authorization'] = self._header
+        return r
+
 
 @dataclass
 class HttpResponse:
     """Response vom HTTP Client"""
     status_code: int
-    body: str
-    headers: Dict[str, str]
+    body: Union[str, bytes]  # Roh-Body (bytes vom HTTP-Backend)
+    headers: Mapping[str, str]  # case-insensitive Mapping des HTTP-Backends, keine Kopie
     elapsed_ms: float
+    encoding: str = 'utf-8'  # charset laut Content-Type
+
+    @cached_property
+    def text(self) -> str:
+        """Body als String (wird nur bei Bedarf und einmal dekodiert)"""
+        body = self.body
+        if isinstance(body, str):
+            return body
+        try:
+            return body.decode(self.encoding, errors='replace')
+        except LookupError:
+            return body.decode('utf-8', errors='replace')
+
+    @property
+    def xml_source(self) -> Union[str, bytes]:
+        """
+        Body für XML-Parser: bytes bei UTF-8 (der Parser liest sie direkt),
+        sonst der dekodierte Text.
+        """
+        if isinstance(self.body, bytes) and self.encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+            return self.text
+        return self.body
 
     def is_successful(self) -> bool:
         """Prüft ob Request erfolgreich war"""
@@ -30,50 +162,84 @@ class HttpClient:
     """
     HTTP Client für SOAP-Requests.
     Wrapper um requests-Bibliothek.
+
+    requests bleibt bewusst die Schicht über urllib3: Digest-/NTLM-Auth,
+    Proxies aus der Umgebung und Redirects kommen von dort. Das Pooling
+    übernimmt ohnehin der urllib3-PoolManager des gemounteten Adapters.
     """
 
     def __init__(
             self,
             verify_ssl: bool = True,
             timeout: int = 30,
-            max_retries: int = 0
+            max_retries: int = 0,
+            pool_size: int = 10
     ):
         """
         Args:
             verify_ssl: Ob SSL-Zertifikate validiert werden sollen
             timeout: Standard-Timeout in Sekunden
             max_retries: Maximale Anzahl automatischer Wiederholungen
+            pool_size: Größe des Connection-Pools (z.B. max_workers im Batch)
         """
         self.verify_ssl = verify_ssl
         self.timeout = timeout
         self.max_retries = max_retries
+        self.pool_size = max(1, pool_size)
         self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        # Auth-Handler je (Typ, Benutzer, Passwort), einmal pro Client erstellt
+        self._auth_cache: Dict[Tuple[Any, ...], Any] = {}
 
         if not verify_ssl:
             warnings.simplefilter('ignore', InsecureRequestWarning)
 
     def _get_session(self) -> requests.Session:
-        """Lazy Session-Initialisierung"""
+        """
+        Lazy Session-Initialisierung.
+        Thread-sicher, damit parallele Batch-Requests dieselbe
+        Keep-Alive-Session (und deren Connection-Pool) nutzen.
+        """
         if self._session is None:
-            self._session = requests.Session()
-
-            # Retry-Strategie konfigurieren
-            if self.max_retries > 0:
-                from requests.adapters import HTTPAdapter
-                from urllib3.util.retry import Retry
-
-                retry_strategy = Retry(
-                    total=self.max_retries,
-                    backoff_factor=1,
-                    status_forcelist=[429, 500, 502, 503, 504],
-                    allowed_methods=["POST"]
-                )
-                adapter = HTTPAdapter(max_retries=retry_strategy)
-                self._session.mount("http://", adapter)
-                self._session.mount("https://", adapter)
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
 
         return self._session
 
+    def _create_session(self) -> requests.Session:
+        """
+        Erstellt die Session inkl. Connection-Pool und Retry-Strategie.
+        Der Pool ist auf pool_size ausgelegt, damit parallele Worker
+        Keep-Alive-Verbindungen wiederverwenden statt neue Sockets zu öffnen.
+        Bei Überbelegung warten Worker auf eine freie Verbindung, statt
+        zusätzliche Verbindungen zu öffnen und danach zu verwerfen.
+        Ein SSLContext pro Pool ermöglicht TLS-Session-Wiederaufnahme
+        bei neuen Verbindungen zum selben Host.
+        """
+        session = requests.Session()
+
+        retry_strategy = 0
+        if self.max_retries > 0:
+            retry_strategy = Retry(
+                total=self.max_retries,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["POST"]
+            )
+
+        adapter = _TlsResumptionAdapter(
+            self.verify_ssl,
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            pool_block=True,
+            max_retries=retry_strategy
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
     def post(
             self,
             url: str,
@@ -126,8 +292,7 @@ class HttpClient:
                 request_headers['Content-Type'] = f"{content_type}; charset=utf-8"
 
         try:
-            import time
-            start_time = time.time()
+            start_time = perf_counter()
 
             response = session.post(
                 url=url,
@@ -140,12 +305,13 @@ class HttpClient:
                 proxies=proxies
             )
 
-            elapsed_ms = (time.time() - start_time) * 1000
+            elapsed_ms = (perf_counter() - start_time) * 1000
 
             return HttpResponse(
                 status_code=response.status_code,
-                body=response.text,
-                headers=dict(response.headers),
+                body=response.content,
+                encoding=_response_encoding(response),
+                headers=response.headers,
                 elapsed_ms=elapsed_ms
             )
 
@@ -178,8 +344,7 @@ class HttpClient:
             request_headers['User-Agent'] = 'Ansible-SOAP-Module/1.0 (Python-requests)'
 
         try:
-            import time
-            start_time = time.time()
+            start_time = perf_counter()
 
             response = session.get(
                 url=url,
@@ -191,12 +356,13 @@ class HttpClient:
                 proxies=proxies
             )
 
-            elapsed_ms = (time.time() - start_time) * 1000
+            elapsed_ms = (perf_counter() - start_time) * 1000
 
             return HttpResponse(
                 status_code=response.status_code,
-                body=response.text,
-                headers=dict(response.headers),
+                body=response.content,
+                encoding=_response_encoding(response),
+                headers=response.headers,
                 elapsed_ms=elapsed_ms
             )
 
@@ -224,14 +390,30 @@ class HttpClient:
             self,
             auth_config: Optional[Dict[str, Any]]
     ) -> Optional[Any]:
-        """Konfiguriert Authentifizierung"""
+        """
+        Konfiguriert Authentifizierung.
+        Handler werden pro Zugangsdaten gecacht, damit Batch-Requests nicht
+        jedes Mal neue Auth-Objekte (bzw. Basic-Header) erzeugen.
+        """
         if not auth_config:
             return None
 
         auth_type = auth_config.get('type')
+        key = (auth_type, auth_config.get('username'), auth_config.get('password'))
+
+        auth = self._auth_cache.get(key)
+        if auth is None:
+            auth = self._create_auth(auth_type, auth_config)
+            if auth is not None:
+                self._auth_cache[key] = auth
+
+        return auth
 
+    @staticmethod
+    def _create_auth(auth_type: Optional[str], auth_config: Dict[str, Any]) -> Optional[Any]:
+        """Erstellt den Auth-Handler für requests"""
         if auth_type == 'basic':
-            return HTTPBasicAuth(
+            return _PrecomputedBasicAuth(
                 auth_config['username'],
                 auth_config['password']
             )
@@ -271,9 +453,10 @@ class HttpClient:
 
     def close(self):
         """Schließt die Session"""
-        if self._session:
-            self._session.close()
-            self._session = None
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
 
     def __enter__(self):
         """Context Manager Entry"""
@@ -2,8 +2,36 @@
 Factory für das Erstellen von Endpoints.
 """
 from typing import Dict, Any
+from operator import itemgetter
 from ...domain.entities.endpoint import Endpoint
 
+# Defaults und Schlüssel der Ansible-Parameter (ein C-Level-Zugriff statt
+# einzelner .get()-Aufrufe)
+_ANSIBLE_DEFAULTS = {
+    'endpoint_name': 'default',
+    'auth_type': 'none',
+    'username': None,
+    'password': None,
+    'cert_path': None,
+    'key_path': None,
+    'timeout': 30,
+    'supported_operations': None,
+}
+_ANSIBLE_KEYS = itemgetter(
+    'endpoint_url', 'endpoint_name', 'auth_type', 'username', 'password',
+    'cert_path', 'key_path', 'timeout', 'supported_operations'
+)
+
+# Defaults und Schlüssel des auth-Abschnitts einer Config-Datei
+_AUTH_DEFAULTS = {
+    'type': 'none',
+    'username': None,
+    'password': None,
+    'cert_path': None,
+    'key_path': None,
+}
+_AUTH_KEYS = itemgetter('type', 'username', 'password', 'cert_path', 'key_path')
+
 
 class EndpointFactory:
     """
@@ -21,16 +49,19 @@ class EndpointFactory:
         Returns:
             Endpoint
         """
+        (url, name, auth_type, username, password,
+         cert_path, key_path, timeout, operations) = _ANSIBLE_KEYS({**_ANSIBLE_DEFAULTS, **params})
+
         return Endpoint(
-            url=params['endpoint_url'],
-            name=params.get('endpoint_name', 'default'),
-            auth_type=params.get('auth_type', 'none'),
-            username=params.get('username'),
-            password=params.get('password'),
-            cert_path=params.get('cert_path'),
-            key_path=params.get('key_path'),
-            default_timeout=params.get('timeout', 30),
-            supported_operations=params.get('supported_operations')
+            url=url,
+            name=name,
+            auth_type=auth_type,
+            username=username,
+            password=password,
+            cert_path=cert_path,
+            key_path=key_path,
+            default_timeout=timeout,
+            supported_operations=operations
         )
 
     @staticmethod
@@ -44,14 +75,18 @@ class EndpointFactory:
         Returns:
             Endpoint
         """
+        auth_type, username, password, cert_path, key_path = _AUTH_KEYS(
+            {**_AUTH_DEFAULTS, **config.get('auth', {})}
+        )
+
         return Endpoint(
             url=config['url'],
             name=config.get('name', 'unnamed'),
-            auth_type=config.get('auth', {}).get('type', 'none'),
-            username=config.get('auth', {}).get('username'),
-            password=config.get('auth', {}).get('password'),
-            cert_path=config.get('auth', {}).get('cert_path'),
-            key_path=config.get('auth', {}).get('key_path'),
+            auth_type=auth_type,
+            username=username,
+            password=password,
+            cert_path=cert_path,
+            key_path=key_path,
             default_timeout=config.get('timeout', 30),
             supported_operations=config.get('operations')
         )
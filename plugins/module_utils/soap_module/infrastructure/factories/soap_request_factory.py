@@ -8,6 +8,9 @@ from ...domain.value_objects.soap_envelope import SoapEnvelope, SoapVersion
 from ...domain.value_objects.soap_action import SoapAction
 from ...domain.value_objects.xml_body import XmlBody
 
+# Versions-String -> SoapVersion (unbekannte Werte wie bisher als 1.2)
+_SOAP_VERSIONS = {version.value: version for version in SoapVersion}
+
 
 class SoapRequestFactory:
   """
@@ -30,6 +33,8 @@ class SoapRequestFactory:
 
     root_tag = None if params.get('skip_request_wrapper', False) else params.get('body_root_tag', 'Request')
 
+    # Aus body_dict erzeugtes XML ist wohlgeformt und muss nicht erneut geparst werden
+    validate_body = True
     if not body_content and params.get('body_dict'):
       # Aus Dictionary erstellen MIT Namespace
       xml_body = XmlBody.from_dict(
@@ -39,20 +44,27 @@ class SoapRequestFactory:
         namespace_prefix=params.get('namespace_prefix'),
       )
       body_content = xml_body.to_string()
+      validate_body = False
 
 
     # SOAP Envelope erstellen
     soap_version_str = params.get('soap_version', '1.1')
-    soap_version = SoapVersion.V1_1 if soap_version_str == '1.1' else SoapVersion.V1_2
-    envelope = SoapEnvelope.from_body(body_content, version=soap_version)
+    soap_version = _SOAP_VERSIONS.get(soap_version_str, SoapVersion.V1_2)
 
     # Namespace am Envelope NUR wenn Prefix gewünscht
+    namespace_declarations = None
     if params.get('namespace'):
       namespace_prefix = params.get('namespace_prefix')
       if namespace_prefix:
-        envelope = envelope.with_namespace(namespace_prefix, params['namespace'])
-
-    final_body = envelope.build()
+        namespace_declarations = {namespace_prefix: params['namespace']}
+
+    # Envelope-Gerüst ist pro Version/Namespace gecacht
+    final_body = SoapEnvelope.wrap(
+      body_content,
+      soap_version,
+      namespace_declarations,
+      validate=validate_body
+    )
 
     # Request erstellen
     request = SoapRequest(
@@ -91,18 +103,16 @@ class SoapRequestFactory:
         SoapRequest
     """
     # SOAP Envelope erstellen
-    soap_version = SoapVersion.V1_1 if endpoint.soap_version == '1.1' else SoapVersion.V1_2
-    envelope = SoapEnvelope.from_body(body_content, version=soap_version)
-
+    soap_version = _SOAP_VERSIONS.get(endpoint.soap_version, SoapVersion.V1_2)
     # Namespace aus Action hinzufügen
-    if action.namespace:
-      envelope = envelope.with_namespace('ns', action.namespace)
+    namespace_declarations = {'ns': action.namespace} if action.namespace else None
+    final_body = SoapEnvelope.wrap(body_content, soap_version, namespace_declarations)
 
     # Request erstellen
     request = SoapRequest(
       endpoint_url=endpoint.url,
       soap_action=action.value,
-      body=envelope.build(),
+      body=final_body,
       namespace=action.namespace,
       soap_version=endpoint.soap_version,
       timeout=endpoint.default_timeout
@@ -1,7 +1,11 @@
 """
 HTTP-basierte Implementierung des SOAP Repository.
 """
-from typing import Optional, Dict
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Tuple, Union
+import threading
 
 from ...domain.entities.soap_request import SoapRequest
 from ...domain.entities.soap_response import SoapResponse, ResponseStatus
@@ -14,6 +18,34 @@ from ...domain.repositories.soap_repository import (
 from ..adapters.http_client import HttpClient, HttpClientError, HttpResponse
 from ..adapters.xml_parser import XmlParser, XmlParserError
 
+# Obergrenze für die pro Repository gemerkten WSDLs
+_MAX_WSDL_CACHE_ENTRIES = 32
+
+# Überlastungs-Status (429/503): Body ist oft kein XML
+_OVERLOAD_STATUS_CODES = (429, 503)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Wartezeit aus einem Retry-After-Header in Sekunden.
+    Der Header enthält Sekunden oder ein HTTP-Datum; ungültige Werte ergeben None.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 class HttpSoapRepository(SoapRepository):
     """
     Repository-Implementierung mit HTTP Client.
@@ -23,19 +55,26 @@ class HttpSoapRepository(SoapRepository):
             self,
             http_client: Optional[HttpClient] = None,
             verify_ssl: bool = True,
-            timeout: int = 30  # ✅ NEU: Standard-Timeout
+            timeout: int = 30,  # ✅ NEU: Standard-Timeout
+            pool_size: int = 10
     ):
         """
         Args:
             http_client: Optional vorkonfigurierter HTTP Client
             verify_ssl: Ob SSL-Zertifikate validiert werden sollen
             timeout: Standard-Timeout in Sekunden (wird nur verwendet wenn kein http_client übergeben wird)
+            pool_size: Größe des Connection-Pools (wird nur verwendet wenn kein http_client übergeben wird)
         """
         self._http_client = http_client or HttpClient(
             verify_ssl=verify_ssl,
-            timeout=timeout  # ✅ Timeout übergeben
+            timeout=timeout,  # ✅ Timeout übergeben
+            pool_size=pool_size
         )
         self._async_responses: Dict[str, SoapResponse] = {}
+        # Geladene WSDLs pro URL: (ETag, Last-Modified, Inhalt), LRU-sortiert.
+        # Pro Repository, da der Inhalt von HTTP-Client und Zugangsdaten abhängt
+        self._wsdl_cache: 'OrderedDict[str, Tuple[Optional[str], Optional[str], str]]' = OrderedDict()
+        self._wsdl_cache_lock = threading.Lock()
 
     def send(self, request: SoapRequest) -> SoapResponse:
         """
@@ -61,17 +100,19 @@ class HttpSoapRepository(SoapRepository):
             # HTTP Request ausführen
             http_response = self._http_client.post(
                 url=request.endpoint_url,
-                body=request.body,
+                body=request.encoded_body,
                 headers=request.headers,
                 auth_config=auth_config,
                 timeout=request.timeout  # ✅ Timeout aus Request verwenden
             )
 
-            # Response validieren
-            if not XmlParser.validate_xml(http_response.body):
+            # Response validieren; 429/503 kommen auch ohne XML-Body als
+            # Response zurück, damit Status und Retry-After erhalten bleiben
+            if (http_response.status_code not in _OVERLOAD_STATUS_CODES
+                    and not XmlParser.validate_xml(http_response.xml_source)):
                 raise InvalidResponseError(
                     "Response ist kein gültiges XML",
-                    raw_response=http_response.body
+                    raw_response=http_response.text
                 )
 
             # SoapResponse erstellen
@@ -158,6 +199,7 @@ class HttpSoapRepository(SoapRepository):
     def get_wsdl(self, url: str) -> Optional[str]:
         """
         Lädt die WSDL-Definition eines Endpoints.
+        Mit ETag/Last-Modified des letzten Abrufs wird bedingt geladen.
 
         Args:
             url: Die WSDL-URL
@@ -165,14 +207,42 @@ class HttpSoapRepository(SoapRepository):
         Returns:
             WSDL-Inhalt als String oder None
         """
+        with self._wsdl_cache_lock:
+            cached = self._wsdl_cache.get(url)
+        headers = None
+        if cached is not None:
+            etag, last_modified, _ = cached
+            headers = {}
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
         try:
-            response = self._http_client.get(url, timeout=10)
-            if response.is_successful():
-                return response.body
-            return None
+            response = self._http_client.get(url, headers=headers, timeout=10)
         except HttpClientError:
             return None
 
+        if response.status_code == 304 and cached is not None:
+            with self._wsdl_cache_lock:
+                if url in self._wsdl_cache:
+                    self._wsdl_cache.move_to_end(url)
+            return cached[2]
+
+        if not response.is_successful():
+            return None
+
+        content = response.text
+        etag = response.headers.get('etag')
+        last_modified = response.headers.get('last-modified')
+        if etag or last_modified:
+            with self._wsdl_cache_lock:
+                self._wsdl_cache[url] = (etag, last_modified, content)
+                self._wsdl_cache.move_to_end(url)
+                if len(self._wsdl_cache) > _MAX_WSDL_CACHE_ENTRIES:
+                    self._wsdl_cache.popitem(last=False)
+        return content
+
     def _create_soap_response(
             self,
             request: SoapRequest,
@@ -194,9 +264,9 @@ class HttpSoapRepository(SoapRepository):
             error_msg = "Authentifizierung fehlgeschlagen"
         elif http_response.status_code == 500:
             # SOAP Fault prüfen
-            if self._contains_soap_fault(http_response.body):
+            if self._contains_soap_fault(http_response.xml_source):
                 status = ResponseStatus.SOAP_FAULT
-                error_msg = self._extract_fault_string(http_response.body)
+                error_msg = self._extract_fault_string(http_response.xml_source)
             else:
                 status = ResponseStatus.ERROR
                 error_msg = "Server-Fehler"
@@ -211,13 +281,14 @@ class HttpSoapRepository(SoapRepository):
             request_id=request.id,
             status=status,
             status_code=http_response.status_code,
-            body=http_response.body,
+            body=http_response.text,
             headers=http_response.headers,
             response_time_ms=http_response.elapsed_ms,
-            error_message=error_msg
+            error_message=error_msg,
+            retry_after=_parse_retry_after(http_response.headers.get('Retry-After'))
         )
 
-    def _contains_soap_fault(self, xml_body: str) -> bool:
+    def _contains_soap_fault(self, xml_body: Union[str, bytes]) -> bool:
         """Prüft ob Response einen SOAP Fault enthält"""
         try:
             element = XmlParser.parse(xml_body)
@@ -229,7 +300,7 @@ class HttpSoapRepository(SoapRepository):
         except XmlParserError:
             return False
 
-    def _extract_fault_string(self, xml_body: str) -> str:
+    def _extract_fault_string(self, xml_body: Union[str, bytes]) -> str:
         """Extrahiert Fault-String aus Response"""
         try:
             element = XmlParser.parse(xml_body)
@@ -185,26 +185,32 @@ IMPORT_SOURCE = None
 
 # Try collection import (when installed via ansible-galaxy)
 try:
-  from ansible_collections.hufschlaeger.soap_client.plugins.module_utils.soap_module import (
-    SoapRequestDTO,
-    DtoMapper,
+  from ansible_collections.hufschlaeger.soap_client.plugins.module_utils.soap_module.application.dtos.soap_request_dto import \
+    SoapRequestDTO
+  from ansible_collections.hufschlaeger.soap_client.plugins.module_utils.soap_module.application.mappers.dto_mappers import \
+    DtoMapper
+  from ansible_collections.hufschlaeger.soap_client.plugins.module_utils.soap_module.application.use_cases.batch_send_use_case import (
     BatchSendUseCase,
-    BatchSendCommand,
-    HttpSoapRepository
+    BatchSendCommand
   )
+  from ansible_collections.hufschlaeger.soap_client.plugins.module_utils.soap_module.infrastructure.repositories.http_soap_repository import \
+    HttpSoapRepository
 
   HAS_SOAP_MODULE = True
   IMPORT_SOURCE = "collection"
 except ImportError as collection_error:
   # Try local import (for development/testing)
   try:
-    from ansible.module_utils.soap_module import (
-      SoapRequestDTO,
-      DtoMapper,
+    from ansible.module_utils.soap_module.application.dtos.soap_request_dto import \
+      SoapRequestDTO
+    from ansible.module_utils.soap_module.application.mappers.dto_mappers import \
+      DtoMapper
+    from ansible.module_utils.soap_module.application.use_cases.batch_send_use_case import (
       BatchSendUseCase,
-      BatchSendCommand,
-      HttpSoapRepository
+      BatchSendCommand
     )
+    from ansible.module_utils.soap_module.infrastructure.repositories.http_soap_repository import \
+      HttpSoapRepository
 
     HAS_SOAP_MODULE = True
     IMPORT_SOURCE = "local"
@@ -219,6 +225,54 @@ except ImportError as collection_error:
     )
 
 
+# Defaults für optionale Parameter je Request
+_REQ_DEFAULTS = {
+  'body_root_tag': 'Request',
+  'namespace_prefix': 'ns',
+  'soap_version': '1.1',
+  'timeout': 30,
+  'auth_type': 'none',
+  'validate': True,
+  'use_cache': False,
+  'max_retries': 0,
+  'strip_namespaces': False,
+  'skip_request_wrapper': False,
+}
+
+
+def _build_command(module, idx, req_params, result, endpoints):
+  """
+  Erstellt DTO, validiert es und mappt es auf ein Command.
+  Requests mit gleicher Endpoint-Konfiguration teilen sich über
+  endpoints (lokal pro Batch) eine Endpoint-Instanz.
+  Bricht das Modul bei ungültigen Parametern mit fail_json ab.
+  """
+  # Set defaults for optional parameters
+  req_params = {**_REQ_DEFAULTS, **req_params}
+
+  # Create DTO
+  try:
+    dto = SoapRequestDTO(**req_params)
+  except TypeError as e:
+    module.fail_json(
+      msg=f'Invalid parameters for request {idx}: {str(e)}',
+      request_index=idx,
+      **result
+    )
+
+  # Validate input
+  is_valid, error = dto.validate_input()
+  if not is_valid:
+    module.fail_json(
+      msg=f'Request {idx} validation failed: {error}',
+      request_index=idx,
+      validation_error=error,
+      **result
+    )
+
+  return DtoMapper.dto_to_command(dto, endpoints)
+
+
 def run_module():
   """Main module execution function"""
 
@@ -258,53 +312,26 @@ def run_module():
     result['total'] = len(module.params['requests'])
     module.exit_json(**result)
 
+  # Ein Repository (und damit eine Session) für alle Requests des Batches.
+  # Pool so groß wie die Anzahl paralleler Worker, damit jeder Worker
+  # eine Keep-Alive-Verbindung behalten kann
+  repository = HttpSoapRepository(
+    verify_ssl=module.params['validate_certs'],
+    pool_size=module.params['max_workers']
+  )
+
   try:
-    # Convert request parameters to DTOs
-    request_dtos = []
-    for idx, req_params in enumerate(module.params['requests']):
-      # Set defaults for optional parameters
-      req_params.setdefault('body_root_tag', 'Request')
-      req_params.setdefault('namespace_prefix', 'ns')
-      req_params.setdefault('soap_version', '1.1')
-      req_params.setdefault('timeout', 30)
-      req_params.setdefault('auth_type', 'none')
-      req_params.setdefault('validate', True)
-      req_params.setdefault('use_cache', False)
-      req_params.setdefault('max_retries', 0)
-      req_params.setdefault('strip_namespaces', False)
-      req_params.setdefault('skip_request_wrapper', False)
-
-      # Create DTO
-      try:
-        dto = SoapRequestDTO(**req_params)
-      except TypeError as e:
-        module.fail_json(
-          msg=f'Invalid parameters for request {idx}: {str(e)}',
-          request_index=idx,
-          **result
-        )
-
-      # Validate input
-      is_valid, error = dto.validate_input()
-      if not is_valid:
-        module.fail_json(
-          msg=f'Request {idx} validation failed: {error}',
-          request_index=idx,
-          validation_error=error,
-          **result
-        )
-
-      request_dtos.append(dto)
-
-    # Initialize repository and use case
-    repository = HttpSoapRepository(
-      verify_ssl=module.params['validate_certs']
-    )
+    # Convert request parameters to commands (DTO, Validierung und Mapping
+    # in einem Durchlauf)
+    endpoints = {}
+    commands = [
+      _build_command(module, idx, req_params, result, endpoints)
+      for idx, req_params in enumerate(module.params['requests'])
+    ]
+
+    # Initialize use case
     use_case = BatchSendUseCase(repository)
 
-    # Convert DTOs to commands
-    commands = [DtoMapper.dto_to_command(dto) for dto in request_dtos]
-
     # Create batch command
     batch_command = BatchSendCommand(
       requests=commands,
@@ -323,15 +350,15 @@ def run_module():
     # Add metadata
     result['import_source'] = IMPORT_SOURCE
 
-    # Cleanup
-    repository.close()
-
   except Exception as e:
     module.fail_json(
       msg=f'Unexpected error during batch execution: {str(e)}',
       exception=str(e),
       **result
     )
+  finally:
+    # Cleanup
+    repository.close()
 
   module.exit_json(**result)
 
@@ -17,7 +17,7 @@ EXAMPLES = r'''
   hufschlaeger.soap_client.soap_request:
     endpoint_url: "https://example.com/soap"
     soap_action: "test"
-    body_xml: "<test>data</test>"
+    body: "<test>data</test>"
 '''
 
 RETURN = r'''
@@ -39,7 +39,7 @@ try:
     SendSoapRequestUseCase
   from ansible_collections.hufschlaeger.soap_client.plugins.module_utils.soap_module.infrastructure.repositories.http_soap_repository import \
     HttpSoapRepository
-  from ansible_collections.hufschlaeger.soap_client.plugins.module_utils.soap_module.application.mappers.dto_mapper import \
+  from ansible_collections.hufschlaeger.soap_client.plugins.module_utils.soap_module.application.mappers.dto_mappers import \
     DtoMapper
 
   HAS_SOAP_MODULE = True
@@ -47,17 +47,45 @@ except ImportError as e:
   SOAP_MODULE_IMPORT_ERROR = str(e)
 
 
+# Felder des SoapRequestDTO; werden in einem Durchlauf aus module.params gelesen
+_DTO_FIELDS = (
+  'endpoint_url', 'soap_action', 'body', 'body_dict', 'body_root_tag',
+  'namespace', 'namespace_prefix', 'skip_request_wrapper', 'soap_version',
+  'soap_header', 'headers', 'timeout', 'auth_type', 'username', 'password',
+  'cert_path', 'key_path', 'validate', 'use_cache', 'max_retries',
+  'extract_xpath', 'strip_namespaces',
+)
+
+
 def run_module():
   module = AnsibleModule(
     argument_spec=dict(
       endpoint_url=dict(type='str', required=True),
       soap_action=dict(type='str', required=False, default=''),
+      body=dict(type='str', required=False, aliases=['body_xml']),
       body_dict=dict(type='dict', required=False),
-      body_xml=dict(type='str', required=False),
-      namespace=dict(type='str', required=False, default=''),
+      body_root_tag=dict(type='str', required=False, default='Request'),
+      namespace=dict(type='str', required=False),
+      namespace_prefix=dict(type='str', required=False),
+      skip_request_wrapper=dict(type='bool', required=False, default=False),
+      soap_version=dict(type='str', required=False, default='1.1', choices=['1.1', '1.2']),
+      soap_header=dict(type='str', required=False),
+      headers=dict(type='dict', required=False),
       timeout=dict(type='int', required=False, default=30),
+      auth_type=dict(type='str', required=False, default='none',
+                     choices=['none', 'basic', 'digest', 'ntlm', 'certificate']),
+      username=dict(type='str', required=False),
+      password=dict(type='str', required=False, no_log=True),
+      cert_path=dict(type='path', required=False),
+      key_path=dict(type='path', required=False, no_log=False),
       validate_certs=dict(type='bool', required=False, default=True),
+      validate=dict(type='bool', required=False, default=True),
+      use_cache=dict(type='bool', required=False, default=False),
+      max_retries=dict(type='int', required=False, default=0),
+      extract_xpath=dict(type='str', required=False),
+      strip_namespaces=dict(type='bool', required=False, default=False),
     ),
+    mutually_exclusive=[('body', 'body_dict')],
     supports_check_mode=True
   )
 
@@ -66,38 +94,38 @@ def run_module():
   if not HAS_SOAP_MODULE:
     module.fail_json(msg='SOAP Module not available', error=SOAP_MODULE_IMPORT_ERROR)
 
+  params = module.params
+
   try:
-    dto = SoapRequestDTO(
-      endpoint_url=module.params['endpoint_url'],
-      soap_action=module.params.get('soap_action', ''),
-      body_dict=module.params.get('body_dict'),
-      body_xml=module.params.get('body_xml'),
-      namespace=module.params.get('namespace', ''),
-      timeout=module.params.get('timeout', 30),
-      validate_certs=module.params.get('validate_certs', True)
-    )
+    # module.params ist bereits validiert; DTO direkt daraus befüllen
+    dto = SoapRequestDTO(**{key: params.get(key) for key in _DTO_FIELDS})
 
     is_valid, error = dto.validate_input()
     if not is_valid:
-      module.fail_json(msg=f'Validation failed: {error}')
+      module.fail_json(msg=f'Input validation failed: {error}', error=error, **result)
 
     command = DtoMapper.dto_to_command(dto)
     repository = HttpSoapRepository(
-      verify_ssl=module.params['validate_certs'],
-      timeout=module.params['timeout']
+      verify_ssl=params['validate_certs'],
+      timeout=params['timeout']
     )
 
     try:
       use_case = SendSoapRequestUseCase(repository)
       response = use_case.execute(command)
-      result.update(response.to_dict())
-      result['changed'] = True
     finally:
       repository.close()
 
   except Exception as e:
-    module.fail_json(msg=f'Error: {str(e)}')
+    module.fail_json(msg=f'Error: {str(e)}', **result)
+
+  result.update(DtoMapper.result_to_dto(response).to_dict())
+
+  if not response.success:
+    result['msg'] = f'SOAP request failed: {response.error_message or "Unknown error"}'
+    module.fail_json(**result)
 
+  result['changed'] = True
   module.exit_json(**result)
 
 
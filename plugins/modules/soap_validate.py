@@ -230,24 +230,28 @@ IMPORT_SOURCE = None
 
 # Try collection import (when installed via ansible-galaxy)
 try:
-  from ansible_collections.hufschlaeger.soap_client.plugins.module_utils.soap_module import (
-    Endpoint,
+  from ansible_collections.hufschlaeger.soap_client.plugins.module_utils.soap_module.domain.entities.endpoint import \
+    Endpoint
+  from ansible_collections.hufschlaeger.soap_client.plugins.module_utils.soap_module.application.use_cases.validate_endpoint_use_case import (
     ValidateEndpointUseCase,
-    ValidateEndpointCommand,
-    HttpSoapRepository
+    ValidateEndpointCommand
   )
+  from ansible_collections.hufschlaeger.soap_client.plugins.module_utils.soap_module.infrastructure.repositories.http_soap_repository import \
+    HttpSoapRepository
 
   HAS_SOAP_MODULE = True
   IMPORT_SOURCE = "collection"
 except ImportError as collection_error:
   # Try local import (for development/testing)
   try:
-    from ansible.module_utils.soap_module import (
-      Endpoint,
+    from ansible.module_utils.soap_module.domain.entities.endpoint import \
+      Endpoint
+    from ansible.module_utils.soap_module.application.use_cases.validate_endpoint_use_case import (
       ValidateEndpointUseCase,
-      ValidateEndpointCommand,
-      HttpSoapRepository
+      ValidateEndpointCommand
     )
+    from ansible.module_utils.soap_module.infrastructure.repositories.http_soap_repository import \
+      HttpSoapRepository
 
     HAS_SOAP_MODULE = True
     IMPORT_SOURCE = "local"
@@ -307,12 +311,13 @@ def run_module():
 
   # Check if SOAP module is available
   if not HAS_SOAP_MODULE:
-    module.fail_json(
+    # result enthält bereits 'msg'; daher ergänzen statt zusätzlich übergeben
+    result.update(
       msg='SOAP Module could not be imported',
       error=SOAP_MODULE_IMPORT_ERROR,
-      hint='Ensure collection is installed: ansible-galaxy collection install hufschlaeger.soap_client',
-      **result
+      hint='Ensure collection is installed: ansible-galaxy collection install hufschlaeger.soap_client'
     )
+    module.fail_json(**result)
 
   if module.check_mode:
     result['msg'] = 'Check mode: validation would be performed for {}'.format(
@@ -90,6 +90,16 @@ class TestBatchSendUseCase(unittest.TestCase):
         self.assertGreaterEqual(result.successful, 0)
         self.assertEqual(result.total, len(commands))
 
+    def test_parallel_empty_batch(self):
+        repo = object()
+        use_case = BatchSendUseCase(repo)
+        use_case._send_use_case = FakeSendUseCase()
+
+        cmd = BatchSendCommand(requests=[], parallel=True, max_workers=4)
+        result = use_case.execute(cmd)
+        self.assertEqual(result.total, 0)
+        self.assertEqual(result.results, [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -36,6 +36,25 @@ class TestDtoMapper(unittest.TestCase):
         # Headers propagated
         self.assertEqual(cmd.custom_headers, {"X-Test": "1"})
 
+    def test_identical_endpoint_config_shares_endpoint(self):
+        def make(action, timeout=30):
+            return SoapRequestDTO(
+                endpoint_url="https://example.com/shared",
+                soap_action=action,
+                body="<a/>",
+                timeout=timeout,
+            )
+
+        endpoints = {}
+        first = DtoMapper.dto_to_command(make("A"), endpoints)
+        second = DtoMapper.dto_to_command(make("B"), endpoints)
+        self.assertIs(first.endpoint, second.endpoint)
+        self.assertIsNot(first.endpoint, DtoMapper.dto_to_command(make("A", timeout=5), endpoints).endpoint)
+
+    def test_endpoints_are_not_shared_without_caller_cache(self):
+        dto = SoapRequestDTO(endpoint_url="https://example.com/shared", soap_action="A", body="<a/>")
+        self.assertIsNot(DtoMapper.dto_to_command(dto).endpoint, DtoMapper.dto_to_command(dto).endpoint)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
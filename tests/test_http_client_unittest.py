@@ -0,0 +1,134 @@
+import ssl
+import unittest
+from unittest import mock
+
+import requests
+from urllib3.util.ssl_ import ssl_wrap_socket
+
+from plugins.module_utils.soap_module.infrastructure.adapters import http_client
+from plugins.module_utils.soap_module.infrastructure.adapters.http_client import HttpClient, HttpResponse
+
+
+class TestHttpClientSession(unittest.TestCase):
+    def test_pool_sized_from_pool_size(self):
+        client = HttpClient(pool_size=8)
+        adapter = client._get_session().get_adapter("https://example.com")
+        self.assertEqual(adapter._pool_maxsize, 8)
+        self.assertTrue(adapter._pool_block)
+        client.close()
+
+    def _pool(self, adapter, cert=None):
+        request = requests.Request("POST", "https://example.com/service").prepare()
+        return adapter.get_connection_with_tls_context(request, verify=True, cert=cert)
+
+    def test_each_pool_gets_its_own_ssl_context(self):
+        client = HttpClient()
+        adapter = client._get_session().get_adapter("https://example.com")
+        plain = self._pool(adapter)
+        with_cert = self._pool(adapter, cert=("client.pem", "client.key"))
+
+        self.assertIs(self._pool(adapter), plain)
+        self.assertIsInstance(plain.conn_kw["ssl_context"], http_client._ResumingSSLContext)
+        self.assertIsNot(with_cert.conn_kw["ssl_context"], plain.conn_kw["ssl_context"])
+        client.close()
+
+    def test_pool_without_cert_never_gets_cert_chain(self):
+        client = HttpClient()
+        adapter = client._get_session().get_adapter("https://example.com")
+        plain = self._pool(adapter)
+        with_cert = self._pool(adapter, cert="client.pem")
+
+        loaded = []
+
+        def load_cert_chain(context, *args):
+            loaded.append((context, args))
+
+        context_cls = http_client._ResumingSSLContext
+        with mock.patch.object(context_cls, "load_cert_chain", load_cert_chain), \
+                mock.patch.object(ssl.SSLContext, "wrap_socket"):
+            # Handshake-Schritt von urllib3 für beide Pools nachstellen
+            for pool in (with_cert, plain):
+                ssl_wrap_socket(
+                    mock.MagicMock(),
+                    keyfile=pool.key_file,
+                    certfile=pool.cert_file,
+                    ssl_context=pool.conn_kw["ssl_context"],
+                    server_hostname=pool.host,
+                )
+
+        self.assertEqual(loaded, [(with_cert.conn_kw["ssl_context"], ("client.pem", None))])
+        client.close()
+
+    def test_tls_session_is_reused_per_host_and_port(self):
+        context = http_client._create_ssl_context(verify_ssl=True)
+        sessions = {443: mock.sentinel.session_443, 8443: mock.sentinel.session_8443}
+
+        def wrap(sock, *args, **kwargs):
+            return mock.Mock(session=sessions[sock.getpeername()[1]])
+
+        with mock.patch.object(ssl.SSLContext, "wrap_socket", side_effect=wrap) as wrap_socket:
+            for port in (443, 8443, 443):
+                sock = mock.Mock()
+                sock.getpeername.return_value = ("192.0.2.1", port)
+                context.wrap_socket(sock, server_hostname="example.com")
+
+        offered = [call.kwargs["session"] for call in wrap_socket.call_args_list]
+        self.assertEqual(offered, [None, None, mock.sentinel.session_443])
+
+    def test_each_client_has_its_own_session(self):
+        first = HttpClient(pool_size=4)
+        second = HttpClient(pool_size=4)
+
+        session = first._get_session()
+        self.assertIs(first._get_session(), session)
+        self.assertIsNot(second._get_session(), session)
+
+        first.close()
+        self.assertIsNone(first._session)
+        self.assertIsNotNone(second._session)
+        second.close()
+
+    def test_auth_handler_is_cached_per_credentials(self):
+        client = HttpClient()
+        config = {"type": "basic", "username": "user", "password": "secret"}
+        auth = client._configure_auth(config)
+        self.assertIs(client._configure_auth(dict(config)), auth)
+        self.assertIsNot(client._configure_auth({**config, "password": "other"}), auth)
+        self.assertIsNone(client._configure_auth({"type": "none"}))
+
+    def test_basic_auth_header(self):
+        request = requests.Request("POST", "https://example.com").prepare()
+        http_client._PrecomputedBasicAuth("user", "secret")(request)
+        self.assertEqual(request.headers["Authorization"], "Basic dXNlcjpzZWNyZXQ=")
+
+
+class TestHttpResponseBody(unittest.TestCase):
+    def _response(self, content, content_type=None):
+        headers = {"Content-Type": content_type} if content_type else {}
+        raw = mock.Mock(content=content, headers=headers)
+        return HttpResponse(
+            status_code=200,
+            body=raw.content,
+            headers=raw.headers,
+            elapsed_ms=0.0,
+            encoding=http_client._response_encoding(raw)
+        )
+
+    def test_defaults_to_utf8_without_charset(self):
+        response = self._response("<a>ä</a>".encode("utf-8"), "text/xml")
+        self.assertEqual(response.text, "<a>ä</a>")
+        # UTF-8 geht als bytes direkt an den Parser
+        self.assertIsInstance(response.xml_source, bytes)
+
+    def test_uses_declared_charset(self):
+        response = self._response("<a>ä</a>".encode("latin-1"), 'text/xml; charset="ISO-8859-1"')
+        self.assertEqual(response.text, "<a>ä</a>")
+        self.assertEqual(response.xml_source, "<a>ä</a>")
+
+    def test_unknown_charset_falls_back_to_utf8(self):
+        response = self._response("<a>ä</a>".encode("utf-8"), "text/xml; charset=unknown-enc")
+        self.assertEqual(response.text, "<a>ä</a>")
+
+
+if __name__ == "__main__":
+    unittest.main()
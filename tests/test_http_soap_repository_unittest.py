@@ -0,0 +1,110 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+from plugins.module_utils.soap_module.domain.entities.soap_request import SoapRequest
+from plugins.module_utils.soap_module.infrastructure.adapters.http_client import HttpResponse
+from plugins.module_utils.soap_module.infrastructure.repositories import http_soap_repository
+from plugins.module_utils.soap_module.infrastructure.repositories.http_soap_repository import (
+    HttpSoapRepository,
+    _parse_retry_after,
+)
+
+
+WSDL = '<definitions><operation name="Ping"/></definitions>'
+
+
+class FakeHttpClient:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers)
+        status_code, body, headers = self.responses.pop(0)
+        return HttpResponse(status_code=status_code, body=body, headers=headers, elapsed_ms=1.0)
+
+    def post(self, url, body, headers=None, auth_config=None, timeout=None):
+        status_code, body, headers = self.responses.pop(0)
+        return HttpResponse(status_code=status_code, body=body, headers=headers, elapsed_ms=1.0)
+
+
+class TestGetWsdl(unittest.TestCase):
+    def test_revalidates_with_etag_and_uses_cached_content_on_304(self):
+        client = FakeHttpClient([
+            (200, WSDL.encode(), {'etag': '"v1"', 'last-modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}),
+            (304, b'', {}),
+        ])
+        repository = HttpSoapRepository(http_client=client)
+        url = 'https://example.com/etag?wsdl'
+
+        self.assertEqual(repository.get_wsdl(url), WSDL)
+        self.assertEqual(repository.get_wsdl(url), WSDL)
+        self.assertIsNone(client.requests[0])
+        self.assertEqual(client.requests[1], {
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT',
+        })
+
+    def test_response_without_validators_is_not_cached(self):
+        client = FakeHttpClient([(200, WSDL.encode(), {}), (200, WSDL.encode(), {})])
+        repository = HttpSoapRepository(http_client=client)
+        url = 'https://example.com/plain?wsdl'
+
+        repository.get_wsdl(url)
+        repository.get_wsdl(url)
+        self.assertEqual(client.requests, [None, None])
+
+    def test_cache_is_per_repository(self):
+        response = (200, WSDL.encode(), {'etag': '"v1"'})
+        url = 'https://example.com/shared?wsdl'
+
+        first = FakeHttpClient([response])
+        HttpSoapRepository(http_client=first).get_wsdl(url)
+        other = FakeHttpClient([response])
+        HttpSoapRepository(http_client=other).get_wsdl(url)
+        self.assertEqual(other.requests, [None])
+
+    def test_cache_is_bounded(self):
+        urls = [f'https://example.com/{index}?wsdl' for index in range(3)]
+        client = FakeHttpClient([(200, WSDL.encode(), {'etag': '"v1"'})] * 3)
+        repository = HttpSoapRepository(http_client=client)
+
+        with mock.patch.object(http_soap_repository, '_MAX_WSDL_CACHE_ENTRIES', 2):
+            for url in urls:
+                repository.get_wsdl(url)
+        self.assertEqual(list(repository._wsdl_cache), urls[1:])
+
+    def test_error_status_returns_none(self):
+        client = FakeHttpClient([(404, b'', {})])
+        repository = HttpSoapRepository(http_client=client)
+        self.assertIsNone(repository.get_wsdl('https://example.com/missing?wsdl'))
+
+
+class TestRetryAfter(unittest.TestCase):
+    def test_overload_status_is_returned_with_retry_after(self):
+        for status_code in (429, 503):
+            client = FakeHttpClient([(status_code, b'busy', {'Retry-After': '7'})])
+            repository = HttpSoapRepository(http_client=client)
+            request = SoapRequest(endpoint_url='https://example.com/service', body='<a/>')
+
+            response = repository.send(request)
+            self.assertEqual(response.status_code, status_code)
+            self.assertEqual(response.body, 'busy')
+            self.assertTrue(response.is_retryable())
+            self.assertEqual(response.retry_after, 7.0)
+
+    def test_retry_after_as_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+        delay = _parse_retry_after(format_datetime(retry_at, usegmt=True))
+        self.assertAlmostEqual(delay, 120, delta=2)
+        self.assertEqual(_parse_retry_after('Mon, 01 Jan 2024 00:00:00 GMT'), 0.0)
+
+    def test_missing_or_invalid_retry_after(self):
+        self.assertIsNone(_parse_retry_after(None))
+        self.assertIsNone(_parse_retry_after('soon'))
+
+
+if __name__ == "__main__":
+    unittest.main()
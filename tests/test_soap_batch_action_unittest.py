@@ -0,0 +1,45 @@
+import unittest
+
+from plugins.action.soap_batch import ActionModule
+
+
+CASES = [
+    ({"Get": {"id": 1, "name": "x"}}, {}, '<Get><id>1</id><name>x</name></Get>'),
+    ({"Get": {"a": "", "b": {}}}, {}, '<Get><a/><b/></Get>'),
+    ({"Get": {"item": [1, {"v": 2}, ""], "none": []}}, {}, '<Get><item>1</item><item><v>2</v></item><item/></Get>'),
+    ({"Get": {"only": []}}, {}, '<Get/>'),
+    ({"Get": {"q": 'a<b & "c">'}}, {}, '<Get><q>a&lt;b &amp; "c"&gt;</q></Get>'),
+    ({"Get": "Größe"}, {}, '<Get>Größe</Get>'),
+    ({"Get": ""}, {}, '<Get/>'),
+    ({"id": 1}, {"root_tag": "Get"}, '<Get><id>1</id></Get>'),
+    (
+        {"Get": {"id": 1}},
+        {"namespace": "urn:x", "namespace_prefix": "m"},
+        '<m:Get xmlns:m="urn:x"><m:id>1</m:id></m:Get>',
+    ),
+    (
+        {"Get": {"id": ""}},
+        {"namespace": "urn:x", "namespace_prefix": None},
+        '<ns0:Get xmlns:ns0="urn:x"><ns0:id/></ns0:Get>',
+    ),
+    ({"Get": "1"}, {"namespace": "urn:x"}, '<ns:Get xmlns:ns="urn:x">1</ns:Get>'),
+]
+
+
+class TestBuildXmlBody(unittest.TestCase):
+    def setUp(self):
+        # _build_xml_body nutzt keinen Task-Kontext
+        self.action = ActionModule.__new__(ActionModule)
+
+    def test_writer(self):
+        for body_dict, kwargs, expected in CASES:
+            with self.subTest(body_dict=body_dict, **kwargs):
+                self.assertEqual(self.action._build_xml_body(body_dict, **kwargs), expected)
+
+    def test_empty_body_dict_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.action._build_xml_body({})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from plugins.module_utils.soap_module.domain.value_objects.soap_envelope import SoapEnvelope, SoapVersion
+
+
+BODY = '<?xml version="1.0"?><m:Get xmlns:m="urn:x"/>'
+HEADER = '<m:Token xmlns:m="urn:x">t</m:Token>'
+
+
+class TestSoapEnvelope(unittest.TestCase):
+    def test_wrap_matches_build(self):
+        namespaces = {"m": "urn:x"}
+        envelope = SoapEnvelope(
+            body_content=BODY,
+            version=SoapVersion.V1_2,
+            header_content=HEADER,
+            namespace_declarations=namespaces,
+        )
+        wrapped = SoapEnvelope.wrap(BODY, SoapVersion.V1_2, namespaces, header_content=HEADER)
+
+        self.assertEqual(wrapped, envelope.build())
+        self.assertIn(f"<soap:Header>{HEADER}</soap:Header><soap:Body><m:Get", wrapped)
+        self.assertEqual(wrapped.count("<?xml"), 1)
+
+    def test_wrap_and_constructor_validate_the_same_way(self):
+        for body, header in (("", None), ("<a>", None), ("<a/>", "<h>")):
+            with self.subTest(body=body, header=header):
+                with self.assertRaises(ValueError):
+                    SoapEnvelope.wrap(body, header_content=header)
+                with self.assertRaises(ValueError):
+                    SoapEnvelope(body_content=body, header_content=header)
+
+    def test_wrap_without_validation_still_rejects_empty_body(self):
+        self.assertIn("<soap:Body><a></soap:Body>", SoapEnvelope.wrap("<a>", validate=False))
+        with self.assertRaises(ValueError):
+            SoapEnvelope.wrap("", validate=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from plugins.module_utils.soap_module.domain.entities.soap_request import SoapRequest
+
+
+class TestSoapRequestEnvelope(unittest.TestCase):
+    def test_body_is_wrapped_for_soap_version(self):
+        request = SoapRequest(endpoint_url="https://example.com", body="<m:Get/>", namespace="urn:x")
+        self.assertEqual(
+            request.get_soap_envelope(),
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/" xmlns:ns="urn:x">\n'
+            '    <soap:Body>\n'
+            '        <m:Get/>\n'
+            '    </soap:Body>\n'
+            '</soap:Envelope>'
+        )
+
+        request_12 = SoapRequest(endpoint_url="https://example.com", body="<a/>", soap_version="1.2")
+        self.assertIn('xmlns:soap="http://www.w3.org/2003/05/soap-envelope">', request_12.get_soap_envelope())
+
+    def test_complete_envelope_is_returned_unchanged(self):
+        body = '<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/"/>'
+        request = SoapRequest(endpoint_url="https://example.com", body=body)
+        self.assertIs(request.get_soap_envelope(), body)
+
+    def test_envelope_is_rebuilt_after_body_change(self):
+        request = SoapRequest(endpoint_url="https://example.com", body="<a/>")
+        first = request.get_soap_envelope()
+        self.assertIs(request.get_soap_envelope(), first)
+
+        request.body = "<b/>"
+        self.assertIn("<b/>", request.get_soap_envelope())
+
+
+if __name__ == "__main__":
+    unittest.main()
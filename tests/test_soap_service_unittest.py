@@ -0,0 +1,77 @@
+import unittest
+from unittest import mock
+
+from plugins.module_utils.soap_module.domain.entities.endpoint import Endpoint
+from plugins.module_utils.soap_module.domain.services import soap_service
+from plugins.module_utils.soap_module.domain.services.soap_service import SoapService
+from plugins.module_utils.soap_module.domain.value_objects.soap_action import SoapAction
+from plugins.module_utils.soap_module.infrastructure.adapters.http_client import HttpResponse
+from plugins.module_utils.soap_module.infrastructure.repositories.http_soap_repository import (
+    HttpSoapRepository,
+)
+
+
+class FakeHttpClient:
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    def post(self, url, body, headers=None, auth_config=None, timeout=None):
+        status_code, body, headers = self.responses.pop(0)
+        return HttpResponse(status_code=status_code, body=body, headers=headers, elapsed_ms=1.0)
+
+
+class TestSoapServiceCacheKey(unittest.TestCase):
+    def setUp(self):
+        self.service = SoapService(repository=object())
+
+    def test_same_request_gives_same_key(self):
+        key = self.service._create_cache_key("https://example.com", "Get", "<a/>", {"m": "urn:x"})
+        self.assertEqual(key, self.service._create_cache_key("https://example.com", "Get", b"<a/>", {"m": "urn:x"}))
+
+    def test_namespace_declarations_are_part_of_the_key(self):
+        plain = self.service._create_cache_key("https://example.com", "Get", "<a/>")
+        with_ns = self.service._create_cache_key("https://example.com", "Get", "<a/>", {"m": "urn:x"})
+        other_ns = self.service._create_cache_key("https://example.com", "Get", "<a/>", {"m": "urn:y"})
+        self.assertEqual(len({plain, with_ns, other_ns}), 3)
+
+
+class TestSoapServiceRetry(unittest.TestCase):
+    def test_retry_waits_for_retry_after_from_server(self):
+        client = FakeHttpClient([
+            (503, b'busy', {'Retry-After': '7'}),
+            (200, b'<ok/>', {}),
+        ])
+        service = SoapService(HttpSoapRepository(http_client=client))
+
+        with mock.patch.object(soap_service.time, "sleep") as sleep:
+            response = service.execute_request_with_retry(
+                Endpoint(url="https://example.com/service"),
+                SoapAction("Get"),
+                "<a/>",
+                max_retries=2,
+            )
+
+        self.assertTrue(response.is_successful())
+        sleep.assert_called_once_with(7.0)
+
+    def test_last_overload_response_is_returned(self):
+        client = FakeHttpClient([
+            (503, b'busy', {'Retry-After': '1'}),
+            (503, b'still busy', {}),
+        ])
+        service = SoapService(HttpSoapRepository(http_client=client))
+
+        with mock.patch.object(soap_service.time, "sleep"):
+            response = service.execute_request_with_retry(
+                Endpoint(url="https://example.com/service"),
+                SoapAction("Get"),
+                "<a/>",
+                max_retries=1,
+            )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.body, "still busy")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+from plugins.module_utils.soap_module.application.use_cases.validate_endpoint_use_case import (
+    ValidateEndpointUseCase,
+    ValidateEndpointCommand,
+)
+from plugins.module_utils.soap_module.domain.entities.endpoint import Endpoint
+
+
+WSDL = (
+    '<definitions xmlns="http://schemas.xmlsoap.org/wsdl/">'
+    '<portType name="Port">'
+    '<operation name="GetUser"><input message="tns:GetUserIn"/></operation>\n'
+    '<operation\n    name="AddUser"/>'
+    '</portType>'
+    '<binding name="Binding">'
+    '<operation name="GetUser"/><operation name="AddUser"/>'
+    '</binding>'
+    '</definitions>'
+)
+
+
+class FakeRepository:
+    def __init__(self, wsdl=None):
+        self.wsdl = wsdl
+
+    def validate_endpoint(self, url):
+        return True
+
+    def get_wsdl(self, url):
+        return self.wsdl
+
+
+class TestValidateEndpointUseCase(unittest.TestCase):
+    def test_wsdl_operations_are_unique_and_ordered(self):
+        use_case = ValidateEndpointUseCase(FakeRepository(WSDL))
+        command = ValidateEndpointCommand(
+            endpoint=Endpoint(url="https://example.com/service", name="default"),
+            check_wsdl=True,
+        )
+
+        result = use_case.execute(command)
+        self.assertTrue(result.has_wsdl)
+        self.assertEqual(result.wsdl_operations, ["GetUser", "AddUser"])
+
+    def test_prefixed_wsdl_operations_are_found(self):
+        use_case = ValidateEndpointUseCase(FakeRepository())
+        wsdl = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<wsdl:definitions xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/" '
+            'xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/">'
+            '<wsdl:portType name="P"><wsdl:operation name="Ping"/><wsdl:operation name="Echo"/></wsdl:portType>'
+            '<wsdl:binding name="B"><wsdl:operation name="Ping"><soap:operation soapAction="urn:Ping"/>'
+            '</wsdl:operation></wsdl:binding>'
+            '</wsdl:definitions>'
+        )
+        self.assertEqual(use_case._extract_operations_from_wsdl(wsdl), ["Ping", "Echo"])
+
+    def test_operation_name_is_read_from_the_operation_tag_only(self):
+        use_case = ValidateEndpointUseCase(FakeRepository())
+        wsdl = '<operation><documentation name="Doc"/></operation><operation name="Ping"/>'
+        self.assertEqual(use_case._extract_operations_from_wsdl(wsdl), ["Ping"])
+
+    def test_declared_encoding_of_decoded_wsdl_is_ignored(self):
+        use_case = ValidateEndpointUseCase(FakeRepository())
+        for encoding in ("ISO-8859-1", "UTF-16"):
+            wsdl = (
+                f'<?xml version="1.0" encoding="{encoding}"?>'
+                '<definitions xmlns="http://schemas.xmlsoap.org/wsdl/">'
+                '<portType name="P"><operation name="GrößeÄndern"/></portType>'
+                '</definitions>'
+            )
+            self.assertEqual(use_case._extract_operations_from_wsdl(wsdl), ["GrößeÄndern"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from plugins.module_utils.soap_module.domain.value_objects.xml_body import XmlBody, HAS_LXML, parse_xml
+
+
+ENVELOPE = (
+    '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/" xmlns:m="urn:example">'
+    '<soap:Body><m:GetResponse><m:item>1</m:item><m:item>2</m:item><m:name>x</m:name></m:GetResponse></soap:Body>'
+    '</soap:Envelope>'
+)
+
+FAULT = (
+    '<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">'
+    '<s:Body><s:Fault><faultcode>s:Client</faultcode><faultstring> Invalid </faultstring></s:Fault></s:Body>'
+    '</s:Envelope>'
+)
+
+
+class TestXmlBody(unittest.TestCase):
+    def test_root_element_is_parsed_once(self):
+        body = XmlBody(ENVELOPE)
+        self.assertIs(body.get_root_element(), body.get_root_element())
+        self.assertEqual(body.get_root_tag(), "Envelope")
+
+    def test_invalid_xml_raises_value_error(self):
+        body = XmlBody("<not-closed")
+        with self.assertRaises(ValueError):
+            body.get_root_element()
+
+    def test_declared_encoding_of_decoded_text_is_ignored(self):
+        for encoding in ("ISO-8859-1", "UTF-16"):
+            body = XmlBody(f'<?xml version="1.0" encoding="{encoding}"?><Größe>Maß</Größe>')
+            self.assertEqual(body.get_root_tag(), "Größe")
+            self.assertEqual(body.get_root_element().text, "Maß")
+
+    def test_bytes_are_parsed_with_declared_encoding(self):
+        xml = '<?xml version="1.0" encoding="ISO-8859-1"?><a>Maß</a>'.encode("latin-1")
+        self.assertEqual(parse_xml(xml).text, "Maß")
+
+    def test_get_namespaces(self):
+        namespaces = XmlBody(ENVELOPE).get_namespaces()
+        self.assertEqual(namespaces["soap"], "http://schemas.xmlsoap.org/soap/envelope/")
+        self.assertEqual(namespaces["m"], "urn:example")
+
+    def test_extract_body_content_and_to_dict(self):
+        content = XmlBody(ENVELOPE).extract_body_content()
+        self.assertIsNotNone(content)
+        self.assertEqual(content.get_root_tag(), "GetResponse")
+        self.assertEqual(content.to_dict(), {"GetResponse": {"item": ["1", "2"], "name": "x"}})
+
+    def test_find_element_returns_stripped_text(self):
+        body = XmlBody(FAULT)
+        self.assertEqual(body.find_element(".//faultstring"), "Invalid")
+        self.assertEqual(body.find_element(".//faultcode"), "s:Client")
+        self.assertIsNone(body.find_element(".//detail"))
+
+    @unittest.skipUnless(HAS_LXML, "XPath-Ausdrücke nur mit lxml")
+    def test_find_element_string_results_are_plain_str(self):
+        body = XmlBody('<a><b id=" 7 ">x</b></a>')
+        self.assertIs(type(body.find_element("//b/@id")), str)
+        self.assertEqual(body.find_element("//b/@id"), "7")
+        self.assertEqual(body.find_element("//b/text()"), "x")
+
+    def test_strip_namespaces_returns_new_body(self):
+        body = XmlBody(ENVELOPE)
+        stripped = body.strip_namespaces()
+        self.assertNotIn("xmlns", stripped.to_string())
+        self.assertEqual(stripped.get_root_tag(), "Envelope")
+        self.assertEqual(stripped.find_element(".//name"), "x")
+        # Original bleibt unverändert
+        self.assertEqual(body.to_string(), ENVELOPE)
+        self.assertIsNone(body.find_element(".//name"))
+
+    def test_equality_ignores_whitespace_between_elements(self):
+        pretty = XmlBody("<a>\n  <b>1</b>\n</a>")
+        compact = XmlBody("<a><b>1</b></a>")
+        self.assertEqual(pretty, compact)
+        self.assertEqual(hash(pretty), hash(compact))
+        self.assertNotEqual(compact, XmlBody("<a><b>2</b></a>"))
+
+
+if __name__ == "__main__":
+    unittest.main()